@@ -1,4 +1,3 @@
-import json
 import os
 from pathlib import Path
 
@@ -33,5 +32,4 @@ completion = client.chat.completions.create(
     messages=messages,
 )
 
-x = json.loads(completion.to_json())
-print(x['choices'][0]['message']['content'])
+print(completion.choices[0].message.content)
@@ -32,7 +32,6 @@ Known limitations of the existing OCR output:
     pipeline.
 """
 
-import json
 import logging
 import os
 import time
@@ -41,6 +40,7 @@ from pathlib import Path
 from azure.core.credentials import AzureKeyCredential
 from azure.ai.documentintelligence import DocumentIntelligenceClient, models
 from dotenv import load_dotenv
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -93,8 +93,8 @@ def save_text(result: models.AnalyzeResult) -> None:
         for i, paragraph in enumerate(result.paragraphs)
     }
     output_file = ROOT / "data" / "raw" / "NFPA 70 NEC 2023_paragraphs.json"
-    with open(output_file, "w", encoding="utf-8") as fopen:
-        json.dump(output_json, fopen)
+    with open(output_file, "wb") as fopen:
+        fopen.write(orjson.dumps(output_json))
     logger.info("Wrote paragraph JSON to %s", output_file)
 
 
@@ -26,7 +26,7 @@ from dotenv import load_dotenv  # pylint: disable=wrong-import-position
 load_dotenv(ROOT / ".env")
 
 from nec_rag.agent.resources import load_embedding_resources  # pylint: disable=wrong-import-position
-from nec_rag.agent.utils import _retrieve  # pylint: disable=wrong-import-position
+from nec_rag.agent.utils import _retrieve_batch  # pylint: disable=wrong-import-position
 from nec_rag.data_preprocessing.embedding.config import MODELS  # pylint: disable=wrong-import-position
 
 logger = logging.getLogger(__name__)
@@ -127,6 +127,7 @@ def run_recall_analysis(embed_fn, collection, n_values: list[int]):
     results: dict[str, dict] = {}
     all_match_details: dict[str, dict] = {}
 
+    scored_cases = []
     for qid, question, _ in EXAM_CASES:
         gt = GROUND_TRUTH[qid]
 
@@ -135,9 +136,13 @@ def run_recall_analysis(embed_fn, collection, n_values: list[int]):
             results[qid] = {n: "n/a" for n in n_values}
             all_match_details[qid] = {"gt": gt, "matches": [], "retrieved_sections": []}
             continue
+        scored_cases.append((qid, question))
 
-        # Retrieve once at the maximum n, then slice for smaller n values
-        retrieved = _retrieve(question, embed_fn, collection, n_results=max_n)
+    # Retrieve every question in one batch at the maximum n, then slice for smaller n values
+    retrieved_batch = _retrieve_batch([question for _, question in scored_cases], embed_fn, collection, n_results=max_n)
+
+    for (qid, _), retrieved in zip(scored_cases, retrieved_batch):
+        gt = GROUND_TRUTH[qid]
 
         # Record detailed info for the full retrieval
         all_ranks = _find_all_match_ranks(retrieved, gt)
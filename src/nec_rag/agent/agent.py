@@ -11,27 +11,39 @@ Usage:
 import argparse
 import logging
 import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from langchain.agents import create_agent
-from langchain_community.callbacks import get_openai_callback
-
-from nec_rag.agent.prompts import AGENT_SYSTEM_PROMPT
-from nec_rag.agent.resources import get_agent_llm, load_cross_encoder, load_embedding_resources
-from nec_rag.agent.tools import IMAGE_EXTENSIONS, browse_nec_structure, explain_image, get_vision_usage, nec_lookup, rag_search, reset_seen_sections, reset_vision_usage
+from nec_rag.agent.utils import configure_logging
 from nec_rag.data_preprocessing.embedding.config import MODELS
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# LangChain, the OpenAI SDK and ChromaDB take seconds to import, so they are
+# imported inside the functions below; ``--help`` and argument errors return
+# immediately, and the web app only pays for them once at startup.
+
 logger = logging.getLogger(__name__)
 
 
 def build_nec_agent(embedding_model_key: str = "azure-large"):
     """Build and return the LangGraph agent with NEC tools.
 
-    Pre-loads the RAG embedding resources so the first tool call is fast.
+    Pre-loads the embedding model, ChromaDB, the cross-encoder, the Azure
+    clients and the NEC indices (concurrently) so the first tool call is fast.
     """
-    # Pre-warm the embedding model, ChromaDB collection, and cross-encoder
-    load_embedding_resources(embedding_model_key)
-    load_cross_encoder()
+    # pylint: disable=import-outside-toplevel
+    from langchain.agents import create_agent
+
+    from nec_rag.agent.prompts import get_agent_system_prompt, get_agent_system_prompt_sha
+    from nec_rag.agent.resources import get_agent_llm, warmup_resources
+    from nec_rag.agent.tools import browse_nec_structure, explain_image, nec_lookup, rag_search
+
+    # Pre-warm every resource the tools need, overlapping disk, CPU and network setup
+    warmup_resources(embedding_model_key)
 
     llm = get_agent_llm()
     tools = [rag_search, browse_nec_structure, nec_lookup, explain_image]
@@ -39,23 +51,96 @@ def build_nec_agent(embedding_model_key: str = "azure-large"):
     agent = create_agent(
         model=llm,
         tools=tools,
-        system_prompt=AGENT_SYSTEM_PROMPT,
+        system_prompt=get_agent_system_prompt(),
     )
 
     logger.info("Agent created with %d tools: %s", len(tools), [t.name for t in tools])
+    logger.info("System prompt sha256=%s (%d chars)", get_agent_system_prompt_sha()[:12], len(get_agent_system_prompt()))
     return agent
 
 
 def _detect_image_paths(text: str) -> list[str]:
     """Extract tokens from user input that look like paths to image files."""
+    from nec_rag.agent.tools import IMAGE_SUFFIXES  # pylint: disable=import-outside-toplevel
+
     image_paths = []
     for token in text.split():
+        # Cheap string check first so ordinary words never cost a stat() call
+        if not token.lower().endswith(IMAGE_SUFFIXES):
+            continue
         path = Path(token).expanduser()
-        if path.suffix.lower() in IMAGE_EXTENSIONS and path.exists():
+        if path.exists():
             image_paths.append(str(path.resolve()))
     return image_paths
 
 
+def _build_nec_agent_in_background(embedding_model_key: str) -> Future:
+    """Start :func:`build_nec_agent` on a daemon thread and return a future for the agent."""
+    future: Future = Future()
+
+    def _build() -> None:
+        try:
+            future.set_result(build_nec_agent(embedding_model_key=embedding_model_key))
+        except BaseException as exc:  # pylint: disable=broad-exception-caught
+            future.set_exception(exc)
+
+    threading.Thread(target=_build, name="nec-agent-build", daemon=True).start()
+    return future
+
+
+def _answer_from_cache(question: str, response_cache, answer_cache, embed_fn) -> tuple[str | None, "np.ndarray | None"]:
+    """Return ``(cached answer or None, question embedding or None)`` for a standalone question.
+
+    The exact-match cache is checked first; the question is only embedded
+    when that misses and the semantic answer cache is enabled, and the
+    embedding is returned so the new answer can be stored under it.
+    """
+    cached_answer = response_cache.get(question)
+    if cached_answer is not None or answer_cache is None:
+        return cached_answer, None
+    question_embedding = embed_fn(question)
+    return answer_cache.lookup(question_embedding), question_embedding
+
+
+def _report_usage(cb, result: dict) -> str:
+    """Log the agent and vision token usage for one question and return the summary line shown under the answer."""
+    from nec_rag.agent.tools import get_vision_usage  # pylint: disable=import-outside-toplevel
+
+    # Combine agent LLM usage (from callback) with standalone vision usage
+    vision = get_vision_usage()
+    total_prompt = cb.prompt_tokens + vision["prompt_tokens"]
+    total_completion = cb.completion_tokens + vision["completion_tokens"]
+    total_tokens = cb.total_tokens + vision["total_tokens"]
+
+    logger.info(
+        "Token usage — agent: %d prompt + %d completion = %d total (%d LLM calls) | "
+        "vision: %d prompt + %d completion = %d total | "
+        "combined: %d prompt + %d completion = %d total",
+        cb.prompt_tokens,
+        cb.completion_tokens,
+        cb.total_tokens,
+        cb.successful_requests,
+        vision["prompt_tokens"],
+        vision["completion_tokens"],
+        vision["total_tokens"],
+        total_prompt,
+        total_completion,
+        total_tokens,
+    )
+
+    # Extract reasoning token count from the final AI message metadata
+    reasoning_tokens = 0
+    token_usage = getattr(result["messages"][-1], "response_metadata", {}).get("token_usage", {})
+    completion_details = token_usage.get("completion_tokens_details", {})
+    if isinstance(completion_details, dict):
+        reasoning_tokens = completion_details.get("reasoning_tokens", 0) or 0
+    elif hasattr(completion_details, "reasoning_tokens"):
+        reasoning_tokens = completion_details.reasoning_tokens or 0
+
+    reasoning_note = f" | reasoning: {reasoning_tokens:,}" if reasoning_tokens else ""
+    return f"[Tokens: {total_tokens:,} ({total_prompt:,} prompt + {total_completion:,} completion){reasoning_note} | LLM calls: {cb.successful_requests}]"
+
+
 def main():
     """Interactive CLI loop: accept user questions and stream agent responses."""
     parser = argparse.ArgumentParser(description="NEC expert agent (LangGraph + Azure OpenAI)")
@@ -67,11 +152,21 @@ def main():
     )
     args = parser.parse_args()
 
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    configure_logging()
+
+    # pylint: disable=import-outside-toplevel
+    from langchain_community.callbacks import get_openai_callback
 
-    agent = build_nec_agent(embedding_model_key=args.model)
-    logger.info("Agent ready. Type your question or 'x' to quit.")
+    from nec_rag.agent.resources import load_answer_cache, load_embedding_resources, load_response_cache
+    from nec_rag.agent.tools import reset_seen_sections, reset_vision_usage
+
+    # Build the agent (ChromaDB, cross-encoder, LLM client) on a worker thread so
+    # resource loading overlaps with the user typing their first question.  The
+    # thread is a daemon so quitting before the build finishes exits at once.
+    agent_future = _build_nec_agent_in_background(args.model)
+    answer_cache = load_answer_cache(args.model)
+    response_cache = load_response_cache(args.model)
+    logger.info("Loading agent in the background. Type your question or 'x' to quit.")
     print()
 
     while True:
@@ -86,11 +181,26 @@ def main():
         if not user_input.strip():
             continue
 
+        # Blocks only on the first question if resources are still loading
+        agent = agent_future.result()
+        embed_fn, _ = load_embedding_resources(args.model)
+
         # If the user references an image file, add a note so the agent knows
         image_paths = _detect_image_paths(user_input)
         if image_paths:
-            attachments = ", ".join(image_paths)
-            user_input += f"\n\n[Attached image(s): {attachments}]"
+            user_input += f"\n\n[Attached image(s): {', '.join(image_paths)}]"
+
+        # Each CLI question is standalone, so a verbatim or near-duplicate
+        # repeat of an earlier text-only question can be answered from cache
+        question_embedding = None
+        if not image_paths:
+            cached_answer, question_embedding = _answer_from_cache(user_input, response_cache, answer_cache, embed_fn)
+            if cached_answer is not None:
+                print()
+                print(cached_answer)
+                print("\n[Answered from cache | Tokens: 0 | LLM calls: 0]")
+                print()
+                continue
 
         # Reset per-invocation state before each agent call
         reset_vision_usage()
@@ -100,45 +210,18 @@ def main():
         with get_openai_callback() as cb:
             result = agent.invoke({"messages": [{"role": "user", "content": user_input}]})
 
-        # Combine agent LLM usage (from callback) with standalone vision usage
-        vision = get_vision_usage()
-        total_prompt = cb.prompt_tokens + vision["prompt_tokens"]
-        total_completion = cb.completion_tokens + vision["completion_tokens"]
-        total_tokens = cb.total_tokens + vision["total_tokens"]
-
-        logger.info(
-            "Token usage — agent: %d prompt + %d completion = %d total (%d LLM calls) | "
-            "vision: %d prompt + %d completion = %d total | "
-            "combined: %d prompt + %d completion = %d total",
-            cb.prompt_tokens,
-            cb.completion_tokens,
-            cb.total_tokens,
-            cb.successful_requests,
-            vision["prompt_tokens"],
-            vision["completion_tokens"],
-            vision["total_tokens"],
-            total_prompt,
-            total_completion,
-            total_tokens,
-        )
-
-        # Extract reasoning token count from the final AI message metadata
-        final_message = result["messages"][-1]
-        reasoning_tokens = 0
-        token_usage = getattr(final_message, "response_metadata", {}).get("token_usage", {})
-        completion_details = token_usage.get("completion_tokens_details", {})
-        if isinstance(completion_details, dict):
-            reasoning_tokens = completion_details.get("reasoning_tokens", 0) or 0
-        elif hasattr(completion_details, "reasoning_tokens"):
-            reasoning_tokens = completion_details.reasoning_tokens or 0
-
         # Print the final response
+        final_message = result["messages"][-1]
         print()
         print(final_message.content)
-        reasoning_note = f" | reasoning: {reasoning_tokens:,}" if reasoning_tokens else ""
-        print(f"\n[Tokens: {total_tokens:,} ({total_prompt:,} prompt + {total_completion:,} completion){reasoning_note} | LLM calls: {cb.successful_requests}]")
+        print(f"\n{_report_usage(cb, result)}")
         print()
 
+        if not image_paths and final_message.content:
+            response_cache.put(user_input, final_message.content)
+            if question_embedding is not None:
+                answer_cache.add(question_embedding, final_message.content)
+
 
 if __name__ == "__main__":
     main()
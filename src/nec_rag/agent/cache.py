@@ -0,0 +1,366 @@
+"""Query caches for the NEC agent.
+
+Embedding a user query is a network round-trip (Azure) or a full transformer
+forward pass (local model), and users frequently repeat the same questions
+across sessions.  The helpers here keep recent query embeddings in memory
+and persist them on disk so a repeated query skips the embedding call
+entirely, and keep exact-match and semantic caches of final answers so a
+verbatim or paraphrased repeat of an earlier question can skip the whole
+agent run.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(*parts: str) -> str:
+    """Return the SHA-256 hex digest of *parts* joined with NUL separators."""
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+def l2_normalise(vector) -> np.ndarray:
+    """Return *vector* as float32 scaled to unit length (zero vectors are returned unchanged)."""
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def normalise_query(text: str) -> str:
+    """Lowercase *text* and collapse runs of whitespace, for use as a cache key."""
+    return " ".join(text.lower().split())
+
+
+# ---------------------------------------------------------------------------
+# In-memory embedding cache
+# ---------------------------------------------------------------------------
+
+
+class MemoryEmbeddingCache:
+    """Thread-safe LRU map from normalised query text to its embedding.
+
+    Sits in front of :class:`EmbeddingDiskCache` so repeats within a process
+    (including case and whitespace variants) cost one dict lookup instead of
+    a file read.  ``stats`` counts hits and misses since construction.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str) -> np.ndarray | None:
+        """Return the cached embedding for *text*, or None on a miss."""
+        key = normalise_query(text)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self.stats["misses"] += 1
+            else:
+                self.stats["hits"] += 1
+                self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, text: str, embedding: np.ndarray) -> None:
+        """Store *embedding* for *text*, dropping the least recently used entry if full."""
+        key = normalise_query(text)
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def wrap(self, embed_fn: Callable[[str], np.ndarray]) -> Callable[[str], np.ndarray]:
+        """Return an embedding function that consults this cache before calling *embed_fn*."""
+
+        def _cached_embed(text: str) -> np.ndarray:
+            cached = self.get(text)
+            if cached is not None:
+                logger.info("Query embedding cache hit (%d hits / %d misses)", self.stats["hits"], self.stats["misses"])
+                return cached
+            embedding = embed_fn(text)
+            self.put(text, embedding)
+            return embedding
+
+        return _cached_embed
+
+
+# ---------------------------------------------------------------------------
+# On-disk embedding cache
+# ---------------------------------------------------------------------------
+
+
+class EmbeddingDiskCache:
+    """Persist query embeddings in a SQLite database inside *cache_dir*.
+
+    Rows are keyed by ``sha256(model_name + "\\0" + text)`` and hold the raw
+    float32 bytes, so a lookup is one primary-key read.  The database runs in
+    WAL mode so the CLI and web processes can read it while another writes.
+    The cache keeps at most *max_entries* rows; once the limit is exceeded
+    the least recently used entries (by ``last_used``, refreshed on every
+    hit) are deleted.
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str, max_entries: int = 10_000):
+        self.cache_dir = cache_dir
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # One connection shared across threads; every access holds self._lock
+        self._conn = sqlite3.connect(cache_dir / "embeddings.sqlite", check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS emb (key TEXT PRIMARY KEY, model TEXT, vec BLOB, last_used REAL)")
+            self._num_entries = self._conn.execute("SELECT COUNT(*) FROM emb").fetchone()[0]
+
+    def _key(self, text: str) -> str:
+        return cache_key(self.model_name, text)
+
+    def get(self, text: str) -> np.ndarray | None:
+        """Return the cached embedding for *text*, or None on a miss."""
+        key = self._key(text)
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT vec FROM emb WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            # Refresh last_used so eviction is least-recently-used
+            self._conn.execute("UPDATE emb SET last_used = ? WHERE key = ?", (time.time(), key))
+        return np.frombuffer(row[0], dtype=np.float32).copy()
+
+    def put(self, text: str, embedding: np.ndarray) -> None:
+        """Store *embedding* for *text*, evicting old entries if over capacity."""
+        key = self._key(text)
+        vec = np.asarray(embedding, dtype=np.float32).tobytes()
+        with self._lock, self._conn:
+            cursor = self._conn.execute("INSERT OR IGNORE INTO emb (key, model, vec, last_used) VALUES (?, ?, ?, ?)", (key, self.model_name, vec, time.time()))
+            if cursor.rowcount == 0:
+                # Already cached: overwrite in place without changing the entry count
+                self._conn.execute("UPDATE emb SET vec = ?, last_used = ? WHERE key = ?", (vec, time.time(), key))
+                return
+            self._num_entries += 1
+            if self._num_entries > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used rows until the cache is back under capacity (caller holds the lock)."""
+        excess = self._num_entries - self.max_entries
+        self._conn.execute("DELETE FROM emb WHERE key IN (SELECT key FROM emb ORDER BY last_used LIMIT ?)", (excess,))
+        self._num_entries = self.max_entries
+        logger.info("Embedding cache: evicted %d entries from %s", excess, self.cache_dir)
+
+    def wrap(self, embed_fn: Callable[[str], np.ndarray]) -> Callable[[str], np.ndarray]:
+        """Return an embedding function that consults this cache before calling *embed_fn*."""
+
+        def _cached_embed(text: str) -> np.ndarray:
+            cached = self.get(text)
+            if cached is not None:
+                return cached
+            embedding = embed_fn(text)
+            self.put(text, embedding)
+            return embedding
+
+        return _cached_embed
+
+
+# ---------------------------------------------------------------------------
+# Semantic (nearest-neighbour) cache
+# ---------------------------------------------------------------------------
+
+
+class SemanticCache:
+    """Map query embeddings to payloads, matching by cosine similarity.
+
+    ``lookup`` returns the payload of the most similar cached query when its
+    cosine similarity is at least *threshold*.  Vectors are L2-normalised on
+    insert so a lookup is a single matrix-vector product.  The cache holds at
+    most *max_entries* items (oldest dropped first), which keeps the brute-force
+    scan well under a millisecond.
+
+    If *cache_dir* is given, entries are appended to ``vectors.f32`` (raw
+    float32 rows) and ``payloads.jsonl`` so the cache survives restarts; payloads
+    must then be JSON-serialisable.  If *ttl_days* is given, entries older than
+    that never match and are dropped when the cache is loaded.
+    """
+
+    def __init__(self, threshold: float = 0.97, max_entries: int = 4096, cache_dir: Path | None = None, ttl_days: float | None = None):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.ttl_seconds = None if ttl_days is None else ttl_days * 86400
+        self._lock = threading.Lock()
+        self._matrix: np.ndarray | None = None
+        self._payloads: list[Any] = []
+        self._created: list[float] = []
+        if cache_dir is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def lookup(self, embedding) -> Any | None:
+        """Return the payload of the closest cached query, or None below the threshold."""
+        with self._lock:
+            if self._matrix is None:
+                return None
+            scores = self._matrix @ l2_normalise(embedding)
+            if self.ttl_seconds is not None:
+                # Expired entries stay in the matrix until the next rewrite but never match
+                scores[np.asarray(self._created) < self._cutoff()] = -np.inf
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None
+            logger.info("Semantic cache hit (similarity %.4f)", scores[best])
+            return self._payloads[best]
+
+    def add(self, embedding, payload: Any) -> None:
+        """Insert a new (embedding, payload) pair, dropping the oldest entry if full."""
+        vector = l2_normalise(embedding)
+        created = time.time()
+        with self._lock:
+            rows = vector[np.newaxis, :] if self._matrix is None else np.vstack([self._matrix, vector])
+            self._payloads.append(payload)
+            self._created.append(created)
+            if len(self._payloads) > self.max_entries:
+                rows = rows[-self.max_entries :]
+                self._payloads = self._payloads[-self.max_entries :]
+                self._created = self._created[-self.max_entries :]
+                self._matrix = rows
+                self._rewrite()
+            else:
+                self._matrix = rows
+                self._append(vector, payload, created)
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_seconds
+
+    # -- persistence --------------------------------------------------------
+
+    def _files(self) -> tuple[Path, Path]:
+        return self.cache_dir / "vectors.f32", self.cache_dir / "payloads.jsonl"
+
+    def _load(self) -> None:
+        vectors_file, payloads_file = self._files()
+        if not (vectors_file.exists() and payloads_file.exists()):
+            return
+        with open(payloads_file, "r", encoding="utf-8") as fopen:
+            records = [json.loads(line) for line in fopen if line.strip()]
+        if not records:
+            return
+        vectors = np.fromfile(vectors_file, dtype=np.float32)
+        dim = vectors.size // len(records)
+        if dim == 0 or dim * len(records) != vectors.size:
+            logger.warning("Semantic cache at %s is inconsistent -- starting empty", self.cache_dir)
+            return
+        matrix = vectors.reshape(len(records), dim)
+        # Entries written before timestamps were recorded count as infinitely old
+        created = np.array([record.get("ts", 0.0) for record in records])
+        keep = np.arange(len(records))[-self.max_entries :]
+        if self.ttl_seconds is not None:
+            keep = keep[created[keep] >= self._cutoff()]
+        if keep.size == 0:
+            vectors_file.unlink()
+            payloads_file.unlink()
+            return
+        self._matrix = matrix[keep]
+        self._payloads = [records[i]["payload"] for i in keep]
+        self._created = created[keep].tolist()
+        if keep.size < len(records):
+            # Compact the files so dropped entries are not re-read on every start
+            self._rewrite()
+        logger.info("Semantic cache loaded: %d entries from %s", len(self._payloads), self.cache_dir)
+
+    def _append(self, vector: np.ndarray, payload: Any, created: float) -> None:
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        vectors_file, payloads_file = self._files()
+        with open(vectors_file, "ab") as fopen:
+            fopen.write(vector.tobytes())
+        with open(payloads_file, "a", encoding="utf-8") as fopen:
+            fopen.write(json.dumps({"payload": payload, "ts": created}) + "\n")
+
+    def _rewrite(self) -> None:
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        vectors_file, payloads_file = self._files()
+        self._matrix.tofile(vectors_file)
+        with open(payloads_file, "w", encoding="utf-8") as fopen:
+            fopen.writelines(json.dumps({"payload": p, "ts": ts}) + "\n" for p, ts in zip(self._payloads, self._created))
+
+
+# ---------------------------------------------------------------------------
+# Exact-match response cache
+# ---------------------------------------------------------------------------
+
+
+class ResponseCache:
+    """Persistent map from a normalised question to the agent's final answer.
+
+    Checked before the semantic cache: a verbatim repeat (up to case and
+    whitespace) costs one SQLite primary-key lookup and no embedding call.
+    Keys also hash the *context* strings (system prompt digest, chat
+    deployment), so changing either starts a fresh keyspace instead of
+    serving answers produced under the old prompt or model.  Rows older than
+    *ttl_days* are ignored and pruned on open.
+    """
+
+    def __init__(self, db_path: Path, context: tuple[str, ...] = (), ttl_days: float = 30.0):
+        self.db_path = db_path
+        self.context = context
+        self.ttl_seconds = ttl_days * 86400
+        self._lock = threading.Lock()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared across threads; every access holds self._lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, question TEXT, response TEXT, created_at INTEGER)")
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (self._cutoff(),))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _key(self, question: str) -> str:
+        return cache_key(normalise_query(question), *self.context)
+
+    def _cutoff(self) -> int:
+        return int(time.time() - self.ttl_seconds)
+
+    def get(self, question: str) -> str | None:
+        """Return the cached response for *question*, or None on a miss or expired row."""
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ? AND created_at >= ?", (self._key(question), self._cutoff())).fetchone()
+        if row is None:
+            return None
+        logger.info("Response cache hit")
+        return row[0]
+
+    def put(self, question: str, response: str) -> None:
+        """Store *response* as the answer to *question*, replacing any previous entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, question, response, created_at) VALUES (?, ?, ?, ?)",
+                (self._key(question), question, response, int(time.time())),
+            )
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,22 +5,32 @@ lookup indices.  These are split from the general utility helpers to
 keep data-loading concerns in their own module.
 """
 
-import json
 import logging
-from pathlib import Path
+import os
+import pickle
+import threading
+from typing import Callable
+
+import orjson
+
+from nec_rag.paths import ROOT
 
 logger = logging.getLogger(__name__)
 
 # Path to the structured NEC JSON (chapter > article > part > subsection)
-ROOT = Path(__file__).parent.parent.parent.parent.resolve()
 STRUCTURED_JSON_PATH = ROOT / "data" / "prepared" / "NFPA 70 NEC 2023_structured.json"
+INDEX_CACHE_DIR = ROOT / "data" / "prepared"
 
-# Module-level cache for expensive data structures
-_CACHE: dict = {
-    "structured_json": None,
-    "section_index": None,
-    "table_page_index": None,
-}
+# Module-level cache for expensive data structures, populated lazily on first access
+# pylint: disable=invalid-name,global-statement
+_structured_json: dict | None = None
+_section_index: dict[str, dict] | None = None
+_table_page_index: dict[str, dict] | None = None
+_sorted_section_ids: tuple[str, ...] | None = None
+_nec_navigation: dict | None = None
+# Guards first-time population of the globals above.  Re-entrant because the
+# index builders call load_structured_json() while already holding it.
+_CACHE_LOCK = threading.RLock()
 
 
 # ---------------------------------------------------------------------------
@@ -34,32 +44,85 @@ def load_structured_json() -> dict:
     Returns the parsed dict from ``data/prepared/NFPA 70 NEC 2023_structured.json``.
     Subsequent calls return the cached object.
     """
-    if _CACHE["structured_json"] is not None:
-        return _CACHE["structured_json"]
+    global _structured_json
+    if _structured_json is not None:
+        return _structured_json
 
-    logger.info("Loading structured NEC data from %s", STRUCTURED_JSON_PATH)
-    with open(STRUCTURED_JSON_PATH, "r", encoding="utf-8") as fopen:
-        data: dict = json.load(fopen)
+    with _CACHE_LOCK:
+        if _structured_json is None:
+            logger.info("Loading structured NEC data from %s", STRUCTURED_JSON_PATH)
+            with open(STRUCTURED_JSON_PATH, "rb") as fopen:
+                data: dict = orjson.loads(fopen.read())
 
-    _CACHE["structured_json"] = data
-    logger.info("Structured data loaded: %d chapters", len(data.get("chapters", [])))
-    return data
+            _structured_json = data
+            logger.info("Structured data loaded: %d chapters", len(data.get("chapters", [])))
+        return _structured_json
 
 
 # ---------------------------------------------------------------------------
-# Section index (section_id -> subsection dict with parent metadata)
+# On-disk pickle cache for indices derived from the structured JSON
 # ---------------------------------------------------------------------------
 
 
-def load_section_index() -> dict[str, dict]:
-    """Build a lookup from section ID (e.g. '250.50') to its subsection dict.
+# Bump when the layout of any cached index changes so stale pickles are rebuilt
+_INDEX_CACHE_VERSION = 1
 
-    Each value is the original subsection dict from the structured JSON,
-    augmented with ``article_num`` and ``article_title`` for convenience.
+
+def _source_signature() -> str:
+    """Return a string identifying the cache format and current structured JSON."""
+    stat = STRUCTURED_JSON_PATH.stat()
+    return f"v{_INDEX_CACHE_VERSION}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def load_cached_index(name: str, build_fn: Callable[[], dict]) -> dict:
+    """Return the index produced by *build_fn*, optionally persisted as ``<name>.pkl``.
+
+    By default the index is simply built: its values are the dicts (or
+    shallow copies sharing their strings) already held by
+    :func:`load_structured_json`, so it costs little extra memory.  Setting
+    ``NEC_INDEX_PICKLE_CACHE=1`` trades that for a faster start: the index is
+    pickled next to the structured JSON together with a ``.sig`` sidecar
+    recording the cache format version and the JSON's mtime and size, and
+    loaded from there while the signature still matches.  An unpickled index
+    is a full private copy of the data it references, and the pickle is
+    trusted on that signature alone, so only enable the cache when the data
+    directory is not writable by anyone else.
     """
-    if _CACHE["section_index"] is not None:
-        return _CACHE["section_index"]
+    if os.getenv("NEC_INDEX_PICKLE_CACHE", "0") != "1":
+        return build_fn()
+
+    pkl_path = INDEX_CACHE_DIR / f"{name}.pkl"
+    sig_path = pkl_path.with_suffix(".sig")
+    signature = _source_signature()
+
+    try:
+        if sig_path.read_text(encoding="utf-8") == signature:
+            with open(pkl_path, "rb") as fopen:
+                index = pickle.load(fopen)
+            logger.info("Loaded cached %s from %s", name, pkl_path)
+            return index
+    except (OSError, pickle.UnpicklingError, EOFError) as exc:
+        logger.info("No usable %s cache (%s) -- rebuilding", name, exc)
+
+    index = build_fn()
+    try:
+        tmp_path = pkl_path.with_suffix(".pkl.tmp")
+        with open(tmp_path, "wb") as fopen:
+            pickle.dump(index, fopen, protocol=5)
+        os.replace(tmp_path, pkl_path)
+        sig_path.write_text(signature, encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Could not write %s cache to %s: %s", name, pkl_path, exc)
+    return index
+
 
+# ---------------------------------------------------------------------------
+# Section index (section_id -> subsection dict with parent metadata)
+# ---------------------------------------------------------------------------
+
+
+def _build_section_index() -> dict[str, dict]:
+    """Walk the structured JSON and index every subsection by its ID."""
     data = load_structured_json()
     index: dict[str, dict] = {}
 
@@ -72,12 +135,71 @@ def load_section_index() -> dict[str, dict]:
                     entry["article_num"] = article["article_num"]
                     entry["article_title"] = article["title"]
                     index[subsection["id"]] = entry
-
-    _CACHE["section_index"] = index
-    logger.info("Section index built: %d subsections", len(index))
     return index
 
 
+def load_section_index() -> dict[str, dict]:
+    """Build a lookup from section ID (e.g. '250.50') to its subsection dict.
+
+    Each value is the original subsection dict from the structured JSON,
+    augmented with ``article_num`` and ``article_title`` for convenience.
+    See :func:`load_cached_index` for the opt-in on-disk cache.
+    """
+    global _section_index
+    if _section_index is not None:
+        return _section_index
+
+    with _CACHE_LOCK:
+        if _section_index is None:
+            index = load_cached_index("section_index", _build_section_index)
+            _section_index = index
+            logger.info("Section index ready: %d subsections", len(index))
+        return _section_index
+
+
+def load_sorted_section_ids() -> tuple[str, ...]:
+    """Return every section ID in sorted order, sorted once and cached.
+
+    Used for "did you mean" suggestions when a lookup misses, so the error
+    path does not re-sort thousands of keys on every call.
+    """
+    global _sorted_section_ids
+    if _sorted_section_ids is not None:
+        return _sorted_section_ids
+
+    with _CACHE_LOCK:
+        if _sorted_section_ids is None:
+            _sorted_section_ids = tuple(sorted(load_section_index()))
+        return _sorted_section_ids
+
+
+# ---------------------------------------------------------------------------
+# Navigation lookups (chapter / article number -> node in the structured JSON)
+# ---------------------------------------------------------------------------
+
+
+def load_nec_navigation() -> dict:
+    """Return chapter and article lookups for browsing the NEC hierarchy, built once.
+
+    Returns ``{"chapters": [...], "chapter_by_num": {1: chapter, ...},
+    "article_by_num": {90: article, ...}}``; values are the original dicts
+    from the structured JSON, not copies.
+    """
+    global _nec_navigation
+    if _nec_navigation is not None:
+        return _nec_navigation
+
+    with _CACHE_LOCK:
+        if _nec_navigation is None:
+            chapters = load_structured_json()["chapters"]  # pylint: disable=unsubscriptable-object
+            _nec_navigation = {
+                "chapters": chapters,
+                "chapter_by_num": {ch["chapter_num"]: ch for ch in chapters},
+                "article_by_num": {art["article_num"]: art for ch in chapters for art in ch["articles"]},
+            }
+        return _nec_navigation
+
+
 # ---------------------------------------------------------------------------
 # Table page index (table_id -> {page, article_num} from referencing subsection)
 # ---------------------------------------------------------------------------
@@ -98,18 +220,21 @@ def load_table_page_index() -> dict[str, dict]:
     page/article hit for each table ID.  Returns e.g.
     ``{"Table690.31(A)(3)(1)": {"page": 610, "article_num": 685}}``.
     """
-    if _CACHE["table_page_index"] is not None:
-        return _CACHE["table_page_index"]
-
-    data = load_structured_json()
-    index: dict[str, dict] = {}
-
-    for chapter in data["chapters"]:  # pylint: disable=unsubscriptable-object
-        for article in chapter["articles"]:
-            for part in article["parts"]:
-                for subsection in part["subsections"]:
-                    _index_table_refs(subsection, article["article_num"], index)
-
-    _CACHE["table_page_index"] = index
-    logger.info("Table page index built: %d entries", len(index))
-    return index
+    global _table_page_index
+    if _table_page_index is not None:
+        return _table_page_index
+
+    with _CACHE_LOCK:
+        if _table_page_index is None:
+            data = load_structured_json()
+            index: dict[str, dict] = {}
+
+            for chapter in data["chapters"]:  # pylint: disable=unsubscriptable-object
+                for article in chapter["articles"]:
+                    for part in article["parts"]:
+                        for subsection in part["subsections"]:
+                            _index_table_refs(subsection, article["article_num"], index)
+
+            _table_page_index = index
+            logger.info("Table page index built: %d entries", len(index))
+        return _table_page_index
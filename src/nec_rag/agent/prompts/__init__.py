@@ -0,0 +1,39 @@
+"""Prompt templates used by the NEC expert agent and its tools.
+
+The prompt text lives in plain ``.txt`` files next to this module so it can be
+diffed and linted without going through Python; each file is read once, on
+first use.
+"""
+
+import functools
+import hashlib
+from importlib import resources
+
+
+def _read_prompt(name: str) -> str:
+    """Return the stripped contents of the prompt file *name* in this package."""
+    return resources.files(__package__).joinpath(name).read_text(encoding="utf-8").strip()
+
+
+@functools.cache
+def get_agent_system_prompt() -> str:
+    """Return the system prompt for the NEC expert agent."""
+    return _read_prompt("agent_system.txt")
+
+
+@functools.cache
+def get_agent_system_prompt_sha() -> str:
+    """Return the SHA-256 hex digest of the agent system prompt's UTF-8 bytes.
+
+    Azure OpenAI caches a repeated request prefix automatically, but only when
+    it is byte-identical, so the system prompt must stay static (no per-call
+    interpolation).  The digest is logged when the agent is built, so a changed
+    prompt -- and the resulting cold prompt cache -- shows up in the logs.
+    """
+    return hashlib.sha256(get_agent_system_prompt().encode("utf-8")).hexdigest()
+
+
+@functools.cache
+def get_vision_system_prompt() -> str:
+    """Return the system prompt used by the ``explain_image`` vision call."""
+    return _read_prompt("vision_system.txt")
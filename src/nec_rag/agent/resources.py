@@ -1,101 +1,446 @@
 """Centralized resource initialization for the NEC agent.
 
 Handles loading and caching of:
+- Shared HTTP connection pool for the Azure OpenAI SDK clients
 - Embedding models (local sentence-transformers or Azure OpenAI)
-- ChromaDB vector store collections
+- ChromaDB vector store collections (exported to an exact in-memory index)
 - LLM clients (agent chat model, standalone vision model)
-- Table index (table_id -> table dict from structured JSON)
+- Table index (table_id -> table dict from structured JSON, and its markdown rendering)
+- Semantic answer cache (question embedding -> final agent answer)
 """
 
+import atexit
+import importlib.util
 import logging
 import os
-
-import chromadb
-from dotenv import load_dotenv
-from langchain_openai import AzureChatOpenAI
-from openai import AzureOpenAI
-
-from nec_rag.agent.loaders import load_structured_json
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from nec_rag.agent.cache import EmbeddingDiskCache, MemoryEmbeddingCache, ResponseCache, SemanticCache, cache_key, l2_normalise
+from nec_rag.agent.loaders import load_cached_index, load_section_index, load_structured_json
+from nec_rag.agent.utils import _format_table_as_markdown
 from nec_rag.data_preprocessing.embedding.config import COLLECTION_NAME, MODELS, ROOT, chroma_path
 
-logger = logging.getLogger(__name__)
+# chromadb, the OpenAI SDK, LangChain and httpx add seconds of import time, so
+# they are imported inside the functions that need them; callers that only
+# use e.g. load_table_index() never pay for them.
+if TYPE_CHECKING:
+    import chromadb
+    import httpx
+    from langchain_openai import AzureChatOpenAI
+    from openai import AzureOpenAI
 
-load_dotenv(ROOT / ".env")
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Cached resources -- populated lazily on first access
 # ---------------------------------------------------------------------------
-_CACHE: dict = {
-    "embed_fn": None,
-    "collection": None,
-    "cross_encoder": None,
-    "agent_llm": None,
-    "vision_client": None,
-    "table_index": None,
-}
+# Lowercase, rebound by their getters: these are lazily set singletons, not constants
+# pylint: disable=invalid-name,global-statement
+_env_loaded = False
+_azure_config: "AzureConfig | None" = None
+_http_client: "httpx.Client | None" = None
+_embed_fn: Callable[[str], np.ndarray] | None = None
+_collection: "chromadb.Collection | None" = None
+_cross_encoder = None
+_agent_llm: "AzureChatOpenAI | None" = None
+_vision_client: "AzureOpenAI | None" = None
+_table_index: dict[str, dict] | None = None
+_sorted_table_ids: tuple[str, ...] | None = None
+_table_markdown: dict[str, str] | None = None
+_answer_cache: SemanticCache | None = None
+_response_cache: ResponseCache | None = None
+
+# One lock per resource: getters check the global without locking (the hot
+# path), then re-check under the lock so concurrent first calls from web
+# worker threads build each resource exactly once.  Separate locks let
+# independent resources (e.g. ChromaDB and the cross-encoder) load in parallel.
+_azure_config_lock = threading.Lock()
+_http_client_lock = threading.Lock()
+_embedding_lock = threading.Lock()
+_cross_encoder_lock = threading.Lock()
+_agent_llm_lock = threading.Lock()
+_vision_client_lock = threading.Lock()
+_table_index_lock = threading.Lock()
+_answer_cache_lock = threading.Lock()
+_response_cache_lock = threading.Lock()
 
 CROSS_ENCODER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
 
+def _ensure_env() -> None:
+    """Load the project's ``.env`` file into ``os.environ`` on first use."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+        load_dotenv(ROOT / ".env")
+        _env_loaded = True
+
+
+# ---------------------------------------------------------------------------
+# Azure OpenAI settings
+# ---------------------------------------------------------------------------
+
+DEFAULT_API_VERSION = "2025-04-01-preview"
+DEFAULT_CHAT_DEPLOYMENT = "gpt-5.2-chat"
+
+
+@dataclass(frozen=True)
+class AzureConfig:
+    """Azure OpenAI settings shared by the agent, vision and embedding clients."""
+
+    api_key: str
+    endpoint: str
+    api_version: str = DEFAULT_API_VERSION
+    chat_deployment: str = DEFAULT_CHAT_DEPLOYMENT
+    vision_deployment: str = DEFAULT_CHAT_DEPLOYMENT
+
+    @classmethod
+    def from_env(cls) -> "AzureConfig":
+        """Build the config from ``os.environ``, failing fast on missing credentials.
+
+        ``AZURE_OPENAI_VISION_DEPLOYMENT`` falls back to the chat deployment
+        so existing ``.env`` files keep working.
+        """
+        missing = [name for name in ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT") if not os.getenv(name, "").strip()]
+        if missing:
+            raise RuntimeError(f"{' and '.join(missing)} must be set in .env")
+
+        chat_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME") or DEFAULT_CHAT_DEPLOYMENT
+        return cls(
+            api_key=os.environ["AZURE_OPENAI_API_KEY"].strip(),
+            endpoint=os.environ["AZURE_OPENAI_ENDPOINT"].strip(),
+            api_version=os.getenv("AZURE_OPENAI_API_VERSION") or DEFAULT_API_VERSION,
+            chat_deployment=chat_deployment,
+            vision_deployment=os.getenv("AZURE_OPENAI_VISION_DEPLOYMENT") or chat_deployment,
+        )
+
+
+def get_azure_config() -> AzureConfig:
+    """Return the Azure settings, reading ``.env`` and the environment only once."""
+    global _azure_config
+    if _azure_config is None:
+        with _azure_config_lock:
+            if _azure_config is None:
+                _ensure_env()
+                _azure_config = AzureConfig.from_env()
+    return _azure_config
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP connection pool
+# ---------------------------------------------------------------------------
+
+
+def get_http_client() -> "httpx.Client":
+    """Return the cached ``httpx.Client`` shared by every Azure OpenAI client.
+
+    The embedding, agent and vision clients talk to the same Azure endpoint,
+    so a single keep-alive pool lets them reuse each other's TCP/TLS
+    connections instead of each paying its own handshake.  When the optional
+    ``h2`` package is installed (``pip install -e ".[http2]"``) the pool
+    speaks HTTP/2, so concurrent tool calls multiplex over one connection.
+    The client is closed at interpreter exit.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                import httpx  # pylint: disable=import-outside-toplevel
+
+                http2 = importlib.util.find_spec("h2") is not None
+                # Pool settings belong on the transport: httpx ignores Client(limits=...) when a transport is given
+                _http_client = httpx.Client(
+                    transport=httpx.HTTPTransport(
+                        retries=2,
+                        http2=http2,
+                        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0),
+                    ),
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                )
+                logger.info("Shared HTTP client created (%s)", "HTTP/2" if http2 else "HTTP/1.1")
+                atexit.register(_http_client.close)
+    return _http_client
+
+
 # ---------------------------------------------------------------------------
 # Embedding + ChromaDB
 # ---------------------------------------------------------------------------
 
 
-def load_embedding_resources(model_key: str = "azure-large"):
-    """Load the embedding function and ChromaDB collection, caching for reuse.
+class _AzureEmbedBatcher:  # pylint: disable=too-few-public-methods
+    """Coalesce concurrent single-query embedding requests into batched API calls.
 
-    Returns (embed_fn, collection) where embed_fn(str) -> list[float].
+    Callers block in :meth:`embed` while a daemon thread drains the queue:
+    after the first request arrives it waits up to *window* seconds for more
+    (at most *max_batch*), then issues one ``embeddings.create`` call and
+    resolves every caller's future.  A lone request costs one extra
+    *window* of latency, negligible next to the HTTPS round-trip it shares.
+    Any failure while handling a batch is set on every unresolved future, and
+    callers give up after *timeout* seconds regardless.
     """
-    if _CACHE["embed_fn"] is not None and _CACHE["collection"] is not None:
-        return _CACHE["embed_fn"], _CACHE["collection"]
 
+    def __init__(self, client: "AzureOpenAI", model: str, max_batch: int = 16, window: float = 0.005, timeout: float = 120.0):
+        self._client = client
+        self._model = model
+        self._max_batch = max_batch
+        self._window = window
+        self._timeout = timeout
+        self._queue: queue.Queue[tuple[str, Future]] = queue.Queue()
+        threading.Thread(target=self._run, name="azure-embed-batcher", daemon=True).start()
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed *text*, sharing an API call with any concurrent requests."""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future.result(timeout=self._timeout)
+
+    def _drain(self) -> list[tuple[str, Future]]:
+        """Block for one request, then collect more until the window closes or the batch is full."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._window
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain()
+            try:
+                self._embed_batch(batch)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Whatever failed, no caller may be left waiting on its future
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    def _embed_batch(self, batch: list[tuple[str, Future]]) -> None:
+        """Embed every text in *batch* with one API call and resolve the futures."""
+        texts = [text for text, _ in batch]
+        response = self._client.embeddings.create(input=texts if len(texts) > 1 else texts[0], model=self._model)
+        if len(response.data) != len(batch):
+            raise RuntimeError(f"Embedding API returned {len(response.data)} vectors for {len(batch)} inputs")
+        if len(batch) > 1:
+            logger.info("Embedded %d queued queries in one request", len(batch))
+        for (_, future), item in zip(batch, sorted(response.data, key=lambda d: d.index)):
+            future.set_result(l2_normalise(item.embedding))
+
+
+class InMemoryCollection:
+    """Exact cosine search over a ChromaDB collection's vectors, held in RAM.
+
+    The NEC corpus is a few thousand subsections, so one ``(N, D)`` float32
+    matrix-vector product plus an ``argpartition`` top-k is faster than a
+    round-trip through Chroma's HNSW index and returns exact neighbours.
+    :meth:`query` mirrors the subset of ``chromadb.Collection.query`` that
+    ``_retrieve`` uses, including cosine *distances* (``1 - similarity``).
+
+    With ``quantise=True`` the matrix is stored as int8 with a per-dimension
+    scale (a quarter of the memory).  Scores are then approximate; they are
+    computed in row blocks so the float32 upcast never materialises the
+    whole matrix.
+    """
+
+    _QUANTISED_BLOCK_ROWS = 1024
+
+    def __init__(self, embeddings, documents: list[str], metadatas: list[dict], quantise: bool = False):
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms > 0, norms, 1.0)
+        self._scale: np.ndarray | None = None
+        if quantise:
+            # Symmetric per-dimension scale, so each column uses the full int8 range
+            max_abs = np.abs(matrix).max(axis=0)
+            self._scale = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+            matrix = np.round(matrix / self._scale).astype(np.int8)
+        self._matrix = matrix
+        self._documents = documents
+        self._metadatas = metadatas
+
+    def _scores(self, query: np.ndarray) -> np.ndarray:
+        """Return the cosine similarity of every indexed vector to the unit vector *query*."""
+        if self._scale is None:
+            return self._matrix @ query
+        # Fold the per-dimension scale into the query: (X_q * s) @ q == X_q @ (s * q)
+        scaled = self._scale * query
+        scores = np.empty(len(self._matrix), dtype=np.float32)
+        step = self._QUANTISED_BLOCK_ROWS
+        for start in range(0, len(self._matrix), step):
+            scores[start : start + step] = self._matrix[start : start + step].astype(np.float32) @ scaled
+        return scores
+
+    @classmethod
+    def from_chroma(cls, collection: "chromadb.Collection", quantise: bool = False) -> "InMemoryCollection":
+        """Export every vector, document and metadata dict from *collection*."""
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        return cls(data["embeddings"], data["documents"], data["metadatas"], quantise=quantise)
+
+    def count(self) -> int:
+        """Return the number of indexed items."""
+        return len(self._documents)
+
+    def query(self, query_embeddings, n_results: int = 10, include=None) -> dict:  # pylint: disable=unused-argument
+        """Return the *n_results* nearest items per query in Chroma's nested-list result shape."""
+        results: dict[str, list] = {"documents": [], "metadatas": [], "distances": []}
+        n_results = min(n_results, self.count())
+        for embedding in query_embeddings:
+            scores = self._scores(l2_normalise(embedding))
+            top = np.argpartition(-scores, n_results)[:n_results] if n_results < len(scores) else np.arange(len(scores))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            results["documents"].append([self._documents[i] for i in top])
+            results["metadatas"].append([self._metadatas[i] for i in top])
+            results["distances"].append((1.0 - scores[top]).tolist())
+        return results
+
+
+def _load_local_embedding_model(model_name: str):
+    """Load a SentenceTransformer for query embedding, optionally optimised, and warm it up.
+
+    Two opt-in speed-ups, both off by default because they change numerics
+    slightly and (for compile) add a one-off compilation delay:
+
+    - ``NEC_EMBED_INT8=1`` (CPU only): load in float32 and apply dynamic int8
+      quantisation to the transformer's Linear layers.
+    - ``NEC_EMBED_COMPILE=1`` (CUDA only): wrap the transformer in
+      ``torch.compile``.
+    """
+    try:
+        import torch  # pylint: disable=import-outside-toplevel
+        from sentence_transformers import SentenceTransformer  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError('Local embedding models require the "local" extras: pip install -e ".[local]"') from exc
+
+    on_gpu = torch.cuda.is_available()
+    # Dynamic quantisation needs float32 weights and only has CPU kernels
+    use_int8 = os.getenv("NEC_EMBED_INT8") == "1" and not on_gpu
+
+    logger.info("Loading local embedding model '%s'...", model_name)
+    st_model = SentenceTransformer(
+        model_name,
+        model_kwargs={"torch_dtype": torch.float32 if use_int8 else torch.float16},
+        tokenizer_kwargs={"padding_side": "left"},
+    )
+
+    if use_int8:
+        st_model[0].auto_model = torch.ao.quantization.quantize_dynamic(st_model[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8)
+        logger.info("Applied int8 dynamic quantisation to '%s'", model_name)
+    elif os.getenv("NEC_EMBED_COMPILE") == "1" and on_gpu:
+        st_model[0].auto_model = torch.compile(st_model[0].auto_model, mode="reduce-overhead", fullgraph=False)
+        logger.info("Compiled '%s' with torch.compile", model_name)
+
+    # The first encode materialises the tokenizer, initialises the compute
+    # kernels and triggers any compilation; pay that here, not on the first query
+    st_model.encode("warm-up", prompt_name="query")
+    return st_model
+
+
+def _build_embedding_resources(model_key: str):
+    """Construct the cached embedding function and open the ChromaDB collection for *model_key*."""
+    _ensure_env()
     model_cfg = MODELS[model_key]
+    embed_cache = EmbeddingDiskCache(chroma_path(model_key).parent / "emb_cache", model_cfg["display_name"])
+    # NEC_EMBED_CACHE_SIZE: recent query embeddings kept in memory, in front of the disk cache
+    memory_cache = MemoryEmbeddingCache(max_entries=int(os.getenv("NEC_EMBED_CACHE_SIZE", "512")))
 
     # Build embedding function based on model type
     if model_cfg["type"] == "local":
-        try:
-            import torch  # pylint: disable=import-outside-toplevel
-            from sentence_transformers import SentenceTransformer  # pylint: disable=import-outside-toplevel
-        except ImportError as exc:
-            raise ImportError('Local embedding models require the "local" extras: pip install -e ".[local]"') from exc
-
-        logger.info("Loading local embedding model '%s'...", model_cfg["display_name"])
-        st_model = SentenceTransformer(
-            model_cfg["display_name"],
-            model_kwargs={"torch_dtype": torch.float16},
-            tokenizer_kwargs={"padding_side": "left"},
-        )
+        st_model = _load_local_embedding_model(model_cfg["display_name"])
 
-        def _local_embed(text: str) -> list[float]:
-            return st_model.encode(text, prompt_name="query").tolist()
+        def _local_embed(text: str) -> np.ndarray:
+            return l2_normalise(st_model.encode(text, prompt_name="query", convert_to_numpy=True))
 
-        _CACHE["embed_fn"] = _local_embed
+        embed_fn = memory_cache.wrap(embed_cache.wrap(_local_embed))
 
     elif model_cfg["type"] == "azure":
+        from openai import AzureOpenAI  # pylint: disable=import-outside-toplevel
+
+        cfg = get_azure_config()
         embedding_client = AzureOpenAI(
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2025-04-01-preview"),
+            api_key=cfg.api_key,
+            azure_endpoint=cfg.endpoint,
+            api_version=cfg.api_version,
+            http_client=get_http_client(),
         )
         logger.info("Using Azure OpenAI embedding model '%s'", model_cfg["display_name"])
 
-        def _azure_embed(text: str) -> list[float]:
-            response = embedding_client.embeddings.create(input=text, model=model_cfg["display_name"])
-            return response.data[0].embedding
-
-        _CACHE["embed_fn"] = _azure_embed
+        # Concurrent queries (parallel tool calls, multiple web sessions) share one request
+        batcher = _AzureEmbedBatcher(embedding_client, model_cfg["display_name"])
+        embed_fn = memory_cache.wrap(embed_cache.wrap(batcher.embed))
 
     else:
         raise ValueError(f"Unknown model type: {model_cfg['type']}")
 
     # Load ChromaDB collection
+    import chromadb  # pylint: disable=import-outside-toplevel
+
     store_path = chroma_path(model_key)
     client = chromadb.PersistentClient(path=str(store_path))
-    _CACHE["collection"] = client.get_collection(name=COLLECTION_NAME)
-    logger.info("ChromaDB collection '%s' loaded (%d items) from %s", COLLECTION_NAME, _CACHE["collection"].count(), store_path)
+    collection = client.get_collection(name=COLLECTION_NAME)
+    # NEC_IN_MEMORY_INDEX=0: query the Chroma HNSW index instead of an exact in-RAM scan
+    # NEC_INDEX_INT8=1: hold the in-RAM matrix as int8 (4x smaller, approximate scores)
+    if os.getenv("NEC_IN_MEMORY_INDEX", "1") != "0":
+        collection = InMemoryCollection.from_chroma(collection, quantise=os.getenv("NEC_INDEX_INT8") == "1")
+        logger.info("ChromaDB collection '%s' loaded into memory (%d items) from %s", COLLECTION_NAME, collection.count(), store_path)
+    # count() is a query against the store, so only pay for it when debugging
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("ChromaDB collection '%s' loaded (%d items) from %s", COLLECTION_NAME, collection.count(), store_path)
+    else:
+        logger.info("ChromaDB collection '%s' loaded from %s", COLLECTION_NAME, store_path)
+
+    return embed_fn, collection
 
-    return _CACHE["embed_fn"], _CACHE["collection"]
+
+def load_embedding_resources(model_key: str = "azure-large"):
+    """Load the embedding function and ChromaDB collection, caching for reuse.
+
+    Returns (embed_fn, collection) where embed_fn(str) -> np.ndarray, a
+    1-D float32 vector (about 7x smaller than the equivalent list of floats).
+    Returned vectors are L2-normalised, so cosine(a, b) == a @ b.  The
+    collection is an :class:`InMemoryCollection` unless
+    ``NEC_IN_MEMORY_INDEX=0`` selects the ChromaDB collection itself.
+    Query embeddings are cached in memory (keyed on lowercased,
+    whitespace-normalised text) and on disk next to the ChromaDB store, so a
+    repeated query skips the embedding model / API call entirely.
+    """
+    global _embed_fn, _collection
+    if _embed_fn is None or _collection is None:
+        with _embedding_lock:
+            if _embed_fn is None or _collection is None:
+                _embed_fn, _collection = _build_embedding_resources(model_key)
+    return _embed_fn, _collection
+
+
+def _prewarm_embedding(model_key: str) -> None:
+    """Thread target for :func:`prewarm_embedding_resources`; logs instead of raising."""
+    try:
+        load_embedding_resources(model_key)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.warning("Embedding prewarm for '%s' failed (will retry on first use): %s", model_key, exc)
+
+
+def prewarm_embedding_resources(model_key: str = "azure-large") -> threading.Thread:
+    """Start loading the embedding model and ChromaDB collection on a daemon thread.
+
+    Callers of :func:`load_embedding_resources` that arrive before the load
+    finishes simply wait on its lock, so the slow model load overlaps with
+    the rest of process startup instead of delaying the first request.
+    """
+    thread = threading.Thread(target=_prewarm_embedding, args=(model_key,), name="nec-embed-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 
 # ---------------------------------------------------------------------------
@@ -109,16 +454,19 @@ def load_cross_encoder():
     Returns a ``sentence_transformers.CrossEncoder`` instance with sigmoid
     activation so scores fall in [0, 1].
     """
-    if _CACHE["cross_encoder"] is not None:
-        return _CACHE["cross_encoder"]
+    global _cross_encoder
+    if _cross_encoder is not None:
+        return _cross_encoder
 
-    import torch  # pylint: disable=import-outside-toplevel
-    from sentence_transformers import CrossEncoder  # pylint: disable=import-outside-toplevel
+    with _cross_encoder_lock:
+        if _cross_encoder is None:
+            import torch  # pylint: disable=import-outside-toplevel
+            from sentence_transformers import CrossEncoder  # pylint: disable=import-outside-toplevel
 
-    logger.info("Loading cross-encoder model '%s'...", CROSS_ENCODER_MODEL)
-    _CACHE["cross_encoder"] = CrossEncoder(CROSS_ENCODER_MODEL, activation_fn=torch.nn.Sigmoid())
-    logger.info("Cross-encoder loaded.")
-    return _CACHE["cross_encoder"]
+            logger.info("Loading cross-encoder model '%s'...", CROSS_ENCODER_MODEL)
+            _cross_encoder = CrossEncoder(CROSS_ENCODER_MODEL, activation_fn=torch.nn.Sigmoid())
+            logger.info("Cross-encoder loaded.")
+    return _cross_encoder
 
 
 # ---------------------------------------------------------------------------
@@ -126,27 +474,122 @@ def load_cross_encoder():
 # ---------------------------------------------------------------------------
 
 
+def _build_table_index() -> dict[str, dict]:
+    """Walk every chapter > article in the structured JSON and index each table by ID."""
+    data = load_structured_json()
+
+    # Walk the hierarchy and collect every table, keyed by normalised ID
+    chapters = data["chapters"]  # pylint: disable=unsubscriptable-object
+    return {table["id"]: table for chapter in chapters for article in chapter["articles"] for table in article["tables"]}
+
+
 def load_table_index() -> dict[str, dict]:
     """Build a lookup from normalised table ID to its structured dict, caching for reuse.
 
-    Walks every chapter > article in the structured JSON and indexes each table
-    by its 'id' field (e.g. 'Table220.55').
+    Indexes each table by its 'id' field (e.g. 'Table220.55'); the values are
+    the table dicts from the structured JSON.  See :func:`load_cached_index`
+    for the opt-in on-disk cache.
     """
-    if _CACHE["table_index"] is not None:
-        return _CACHE["table_index"]
+    global _table_index
+    if _table_index is not None:
+        return _table_index
 
-    data = load_structured_json()
+    with _table_index_lock:
+        if _table_index is None:
+            _table_index = load_cached_index("table_index", _build_table_index)
+            logger.info("Table index ready: %d tables", len(_table_index))
+    return _table_index
 
-    # Walk the hierarchy and collect every table, keyed by normalised ID
-    index: dict[str, dict] = {}
-    for chapter in data["chapters"]:
-        for article in chapter["articles"]:
-            for table in article["tables"]:
-                index[table["id"]] = table
 
-    _CACHE["table_index"] = index
-    logger.info("Table index built: %d tables", len(index))
-    return index
+def load_sorted_table_ids() -> tuple[str, ...]:
+    """Return every table ID in sorted order, sorted once and cached (for lookup suggestions)."""
+    global _sorted_table_ids
+    if _sorted_table_ids is not None:
+        return _sorted_table_ids
+
+    table_index = load_table_index()
+    with _table_index_lock:
+        if _sorted_table_ids is None:
+            _sorted_table_ids = tuple(sorted(table_index))
+    return _sorted_table_ids
+
+
+def load_table_markdown() -> dict[str, str]:
+    """Return every table rendered as markdown, keyed by table ID, rendered once and cached.
+
+    The NEC tables are static, so ``nec_lookup`` serves them with a dict
+    lookup instead of re-running the header/row/footnote loop per call.
+    """
+    global _table_markdown
+    if _table_markdown is not None:
+        return _table_markdown
+
+    table_index = load_table_index()
+    with _table_index_lock:
+        if _table_markdown is None:
+            _table_markdown = {tid: _format_table_as_markdown(table) for tid, table in table_index.items()}
+    return _table_markdown
+
+
+# ---------------------------------------------------------------------------
+# Semantic answer cache (question embedding -> final agent answer)
+# ---------------------------------------------------------------------------
+
+
+def load_answer_cache(model_key: str = "azure-large") -> SemanticCache | None:
+    """Return the persistent semantic cache of final agent answers, or None if disabled.
+
+    Off unless ``NEC_ANSWER_CACHE=1``: NEC questions that differ only in a
+    number (an ampacity, a section) embed almost identically, so a
+    near-duplicate match can serve the wrong answer.  Entries are keyed by
+    question embeddings from *model_key*'s embedding model and expire after
+    ``NEC_ANSWER_CACHE_TTL_DAYS``.  Like :func:`load_response_cache`, the
+    cache lives in a directory named after the system prompt digest and chat
+    deployment, so editing the prompt or switching models starts it empty.
+    Callers should only consult it for standalone questions (no prior
+    conversation turns or attached images), since the cached answer ignores
+    any such context.
+    """
+    global _answer_cache
+    if _answer_cache is None:
+        with _answer_cache_lock:
+            if _answer_cache is None:
+                _ensure_env()
+                if os.getenv("NEC_ANSWER_CACHE", "0") != "1":
+                    return None
+                from nec_rag.agent.prompts import get_agent_system_prompt_sha  # pylint: disable=import-outside-toplevel
+
+                # Minimum cosine similarity for a new question to reuse a cached answer
+                threshold = float(os.getenv("NEC_ANSWER_CACHE_THRESHOLD", "0.97"))
+                ttl_days = float(os.getenv("NEC_ANSWER_CACHE_TTL_DAYS", "30"))
+                context = cache_key(get_agent_system_prompt_sha(), get_azure_config().chat_deployment)
+                cache_dir = chroma_path(model_key).parent / "answer_cache" / f"semantic-{context[:16]}"
+                _answer_cache = SemanticCache(threshold=threshold, cache_dir=cache_dir, ttl_days=ttl_days)
+    return _answer_cache
+
+
+def load_response_cache(model_key: str = "azure-large") -> ResponseCache:
+    """Return the persistent exact-match cache of final agent answers, caching for reuse.
+
+    Keys combine the normalised question with the system prompt digest and
+    chat deployment, so editing the prompt or switching models invalidates
+    every entry.  The same standalone-question restriction as
+    :func:`load_answer_cache` applies.
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                from nec_rag.agent.prompts import get_agent_system_prompt_sha  # pylint: disable=import-outside-toplevel
+
+                # NEC_RESPONSE_CACHE_TTL_DAYS: how long an exact-match answer stays valid
+                ttl_days = float(os.getenv("NEC_RESPONSE_CACHE_TTL_DAYS", "30"))
+                _response_cache = ResponseCache(
+                    chroma_path(model_key).parent / "answer_cache" / "responses.sqlite",
+                    context=(get_agent_system_prompt_sha(), get_azure_config().chat_deployment),
+                    ttl_days=ttl_days,
+                )
+    return _response_cache
 
 
 # ---------------------------------------------------------------------------
@@ -154,7 +597,7 @@ def load_table_index() -> dict[str, dict]:
 # ---------------------------------------------------------------------------
 
 
-def get_agent_llm(reasoning_effort: str = "medium") -> AzureChatOpenAI:
+def get_agent_llm(reasoning_effort: str = "medium") -> "AzureChatOpenAI":
     """Return the cached AzureChatOpenAI instance used as the agent's reasoning model.
 
     Args:
@@ -165,17 +608,23 @@ def get_agent_llm(reasoning_effort: str = "medium") -> AzureChatOpenAI:
             leaving behaviour model-version-dependent — we explicitly set
             ``"medium"`` so reasoning is guaranteed regardless of server defaults.
     """
-    if _CACHE["agent_llm"] is None:
-        deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-5.2-chat")
-        _CACHE["agent_llm"] = AzureChatOpenAI(
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            azure_deployment=deployment,
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2025-04-01-preview"),
-            reasoning_effort=reasoning_effort,
-        )
-        logger.info("Agent LLM initialised: %s (reasoning_effort=%s)", deployment, reasoning_effort)
-    return _CACHE["agent_llm"]
+    global _agent_llm
+    if _agent_llm is None:
+        with _agent_llm_lock:
+            if _agent_llm is None:
+                from langchain_openai import AzureChatOpenAI  # pylint: disable=import-outside-toplevel
+
+                cfg = get_azure_config()
+                _agent_llm = AzureChatOpenAI(
+                    azure_endpoint=cfg.endpoint,
+                    api_key=cfg.api_key,
+                    azure_deployment=cfg.chat_deployment,
+                    api_version=cfg.api_version,
+                    reasoning_effort=reasoning_effort,
+                    http_client=get_http_client(),
+                )
+                logger.info("Agent LLM initialised: %s (reasoning_effort=%s)", cfg.chat_deployment, reasoning_effort)
+    return _agent_llm
 
 
 # ---------------------------------------------------------------------------
@@ -183,18 +632,63 @@ def get_agent_llm(reasoning_effort: str = "medium") -> AzureChatOpenAI:
 # ---------------------------------------------------------------------------
 
 
-def get_vision_client() -> AzureOpenAI:
+def get_vision_client() -> "AzureOpenAI":
     """Return the cached AzureOpenAI client used for standalone vision calls."""
-    if _CACHE["vision_client"] is None:
-        _CACHE["vision_client"] = AzureOpenAI(
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2025-04-01-preview"),
-        )
-        logger.info("Vision client initialised")
-    return _CACHE["vision_client"]
+    global _vision_client
+    if _vision_client is None:
+        with _vision_client_lock:
+            if _vision_client is None:
+                from openai import AzureOpenAI  # pylint: disable=import-outside-toplevel
+
+                cfg = get_azure_config()
+                _vision_client = AzureOpenAI(
+                    api_key=cfg.api_key,
+                    azure_endpoint=cfg.endpoint,
+                    api_version=cfg.api_version,
+                    http_client=get_http_client(),
+                )
+                logger.info("Vision client initialised")
+    return _vision_client
 
 
 def get_vision_deployment() -> str:
     """Return the Azure deployment name to use for vision requests."""
-    return os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-5.2-chat")
+    return get_azure_config().vision_deployment
+
+
+# ---------------------------------------------------------------------------
+# Startup warm-up
+# ---------------------------------------------------------------------------
+
+
+def warmup_resources(model_key: str = "azure-large") -> None:
+    """Initialise every lazily loaded resource concurrently and wait for all of them.
+
+    ChromaDB and the NEC JSON are disk-bound, the cross-encoder is CPU-bound
+    and the Azure clients are network-bound, so loading them side by side
+    costs roughly the slowest one rather than the sum.  The per-resource
+    locks make this safe alongside any other caller.  The first failure is
+    re-raised once every task has finished.
+    """
+    tasks = [
+        lambda: load_embedding_resources(model_key),
+        load_cross_encoder,
+        get_agent_llm,
+        get_vision_client,
+        load_table_index,
+        load_section_index,
+    ]
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="nec-warmup") as pool:
+        futures = [pool.submit(task) for task in tasks]
+    for future in futures:
+        future.result()
+    logger.info("All agent resources loaded")
+
+
+# NEC_PREWARM_EMBEDDING=1 (or a model key from MODELS) starts loading the
+# embedding resources as soon as this module is imported.  Off by default so
+# tests and tools that never embed a query don't pay for it.  Read from the
+# process environment only -- .env is not loaded yet at import time.
+_PREWARM = os.getenv("NEC_PREWARM_EMBEDDING", "")
+if _PREWARM not in ("", "0"):
+    prewarm_embedding_resources(_PREWARM if _PREWARM in MODELS else "azure-large")
@@ -7,30 +7,41 @@ Provides LangChain tools:
 - browse_nec_structure: navigate the NEC hierarchy and list section outlines
 """
 
-import base64
+import functools
 import logging
+import mmap
+import os
 from pathlib import Path
 
 from langchain_core.tools import tool
 
-from nec_rag.agent.loaders import load_section_index, load_structured_json
-from nec_rag.agent.prompts import VISION_SYSTEM_PROMPT
-from nec_rag.agent.resources import get_vision_client, get_vision_deployment, load_cross_encoder, load_embedding_resources, load_table_index
+# pybase64 (the "fast-base64" extra) wraps SIMD libbase64 and is a drop-in for the stdlib encoder
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+from nec_rag.agent.cache import SemanticCache
+from nec_rag.agent.loaders import load_nec_navigation, load_section_index, load_sorted_section_ids
+from nec_rag.agent.prompts import get_vision_system_prompt
+from nec_rag.agent.resources import get_vision_client, get_vision_deployment, load_cross_encoder, load_embedding_resources, load_sorted_table_ids, load_table_markdown
 from nec_rag.agent.utils import (
     _INT_TO_ROMAN,
     _build_context,
     _build_subsection_text,
-    _format_article_outline,
-    _format_table_as_markdown,
     _rerank,
     _retrieve,
+    cached_article_outline,
     normalize_table_id,
     suggest_similar_ids,
 )
 
 logger = logging.getLogger(__name__)
 
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+# MIME type sent in the vision data URI for each supported image extension
+IMAGE_MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".gif": "image/gif", ".webp": "image/webp"}
+IMAGE_EXTENSIONS = frozenset(IMAGE_MIME_TYPES)
+IMAGE_SUFFIXES = tuple(IMAGE_EXTENSIONS)  # for str.endswith checks on raw filenames
 
 # ---------------------------------------------------------------------------
 # Vision token usage accumulator (not captured by LangChain's callback)
@@ -69,6 +80,17 @@ def reset_seen_sections() -> None:
 
 _RAG_SEARCH_NUM_RESULTS = 50  # candidate pool size for embedding retrieval (fed into cross-encoder)
 
+# Re-ranked results of recent queries, keyed by query embedding.  A paraphrase
+# of an earlier query (cosine >= 0.97) reuses them and skips the ChromaDB query
+# and the cross-encoder pass; seen-section filtering still runs on every call.
+_rag_cache = SemanticCache(threshold=0.97, max_entries=256)
+
+
+def reset_rag_cache() -> None:
+    """Drop all cached rag_search results (e.g. after the collection is rebuilt)."""
+    global _rag_cache  # pylint: disable=global-statement
+    _rag_cache = SemanticCache(threshold=_rag_cache.threshold, max_entries=_rag_cache.max_entries)
+
 
 @tool(parse_docstring=True)
 def rag_search(user_request: str) -> str:
@@ -120,11 +142,15 @@ def rag_search(user_request: str) -> str:
     """
     embed_fn, collection = load_embedding_resources()
     cross_encoder = load_cross_encoder()
-    logger.info("rag_search: user_request=%s  num_results=%d", user_request, _RAG_SEARCH_NUM_RESULTS)
+    logger.info("rag_search: user_request=%.80s  num_results=%d", user_request, _RAG_SEARCH_NUM_RESULTS)
 
-    # Retrieve a wide candidate pool, then re-rank and merge
-    retrieved = _retrieve(user_request, embed_fn, collection, n_results=_RAG_SEARCH_NUM_RESULTS)
-    merged = _rerank(user_request, retrieved, cross_encoder, top_n_rerank=10, top_n_embed=5)
+    # Retrieve a wide candidate pool, then re-rank and merge (unless a near-identical query is cached)
+    query_embedding = embed_fn(user_request)
+    merged = _rag_cache.lookup(query_embedding)
+    if merged is None:
+        retrieved = _retrieve(user_request, embed_fn, collection, n_results=_RAG_SEARCH_NUM_RESULTS, query_embedding=query_embedding)
+        merged = _rerank(user_request, retrieved, cross_encoder, top_n_rerank=10, top_n_embed=5)
+        _rag_cache.add(query_embedding, merged)
 
     # Filter out subsections the agent has already seen from prior rag_search calls
     new_results = [r for r in merged if r["metadata"]["section_id"] not in _seen_section_ids]
@@ -143,6 +169,28 @@ def rag_search(user_request: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+_VISION_MAX_IMAGE_BYTES = 20 * 1024 * 1024  # Azure OpenAI's per-image limit for vision input
+_B64_CHUNK_BYTES = 3 * 57 * 1024  # multiple of 3, so chunks encode without mid-stream padding
+
+
+def _encode_image_base64(path: Path, prefix: str = "") -> str:
+    """Base64-encode the file at *path* into a string starting with *prefix*.
+
+    The file is memory-mapped and encoded chunk by chunk from slices of the
+    mapping, so the raw image is never copied into a userspace ``bytes``
+    buffer.  Building the ``data:`` URI header into the same buffer means
+    the multi-MB payload is copied into a ``str`` exactly once.
+    """
+    encoded = bytearray(prefix.encode("ascii"))
+    with open(path, "rb") as fopen:
+        if os.fstat(fopen.fileno()).st_size == 0:  # mmap refuses empty files
+            return encoded.decode("ascii")
+        with mmap.mmap(fopen.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            for start in range(0, len(view), _B64_CHUNK_BYTES):
+                encoded += base64.b64encode(view[start : start + _B64_CHUNK_BYTES])
+    return encoded.decode("ascii")
+
+
 @tool(parse_docstring=True)
 def explain_image(file_path: str, user_question: str = "") -> str:
     """Analyze an image related to electrical wiring, installations, or the NEC.
@@ -165,33 +213,38 @@ def explain_image(file_path: str, user_question: str = "") -> str:
     Returns:
         str: A detailed text description of the image produced by the vision LLM.
     """
-    path = Path(file_path).expanduser().resolve()
-    if not path.exists():
-        return f"Error: image file not found at {path}"
-    if path.suffix.lower() not in IMAGE_EXTENSIONS:
-        return f"Error: unsupported image format '{path.suffix}'. Supported: {IMAGE_EXTENSIONS}"
-
-    # Base64-encode the image for the OpenAI vision API
-    with open(path, "rb") as f:
-        image_b64 = base64.b64encode(f.read()).decode("utf-8")
-
-    suffix = path.suffix.lower().lstrip(".")
-    mime_type = "jpeg" if suffix == "jpg" else suffix
-    data_uri = f"data:image/{mime_type};base64,{image_b64}"
+    # One stat serves both the existence and size checks; open() follows symlinks, so no resolve()
+    path = Path(file_path).expanduser()
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return f"Error: image file not found at {path.absolute()}"
+    except OSError as exc:
+        return f"Error: cannot read image file at {path.absolute()}: {exc.strerror or exc}"
+    if not path.name.lower().endswith(IMAGE_SUFFIXES):
+        return f"Error: unsupported image format '{path.suffix}'. Supported: {', '.join(sorted(IMAGE_EXTENSIONS))}"
+    if size > _VISION_MAX_IMAGE_BYTES:
+        return f"Error: image is {size / 1024 / 1024:.1f} MB; the vision model accepts at most {_VISION_MAX_IMAGE_BYTES // 1024 // 1024} MB"
+
+    # Base64-encode the image as a data URI for the OpenAI vision API
+    try:
+        data_uri = _encode_image_base64(path, prefix=f"data:{IMAGE_MIME_TYPES[path.suffix.lower()]};base64,")
+    except OSError as exc:
+        return f"Error: cannot read image file at {path.absolute()}: {exc.strerror or exc}"
 
     # Build the user message with optional question context
     user_text = "Describe this image in detail."
     if user_question:
         user_text = f'The user asked: "{user_question}"\n\nDescribe this image in detail, focusing on aspects relevant to the user\'s question.'
 
-    logger.info("explain_image: sending %s (%.1f KB) to vision LLM", path.name, len(image_b64) / 1024)
+    logger.info("explain_image: sending %s (%.1f KB) to vision LLM", path.name, len(data_uri) / 1024)
 
     # Standalone vision LLM call (separate from the agent's own LLM context)
     vision_client = get_vision_client()
     response = vision_client.chat.completions.create(
         model=get_vision_deployment(),
         messages=[
-            {"role": "system", "content": VISION_SYSTEM_PROMPT},
+            {"role": "system", "content": get_vision_system_prompt()},
             {
                 "role": "user",
                 "content": [
@@ -280,8 +333,7 @@ def nec_lookup(section_ids: list[str] | None = None, table_ids: list[str] | None
         for sid in section_ids:
             subsection = section_index.get(sid)
             if subsection is None:
-                valid_ids = sorted(section_index.keys())
-                suggestions = suggest_similar_ids(sid, valid_ids)
+                suggestions = suggest_similar_ids(sid, load_sorted_section_ids())
                 hint = ", ".join(suggestions) if suggestions else "(no similar IDs found)"
                 output_parts.append(f"Error: section '{sid}' not found. Similar section IDs: {hint}")
                 logger.warning("nec_lookup: section '%s' not found", sid)
@@ -293,18 +345,17 @@ def nec_lookup(section_ids: list[str] | None = None, table_ids: list[str] | None
 
     # --- Table lookups ---
     if table_ids:
-        table_index = load_table_index()
+        table_markdown = load_table_markdown()
         for tid in table_ids:
             normalised = normalize_table_id(tid)
-            table = table_index.get(normalised)
-            if table is None:
-                valid_ids = sorted(table_index.keys())
-                suggestions = suggest_similar_ids(normalised, valid_ids)
+            markdown = table_markdown.get(normalised)
+            if markdown is None:
+                suggestions = suggest_similar_ids(normalised, load_sorted_table_ids())
                 hint = ", ".join(suggestions) if suggestions else "(no similar IDs found)"
                 output_parts.append(f"Error: table '{tid}' (normalised: '{normalised}') not found. Similar table IDs: {hint}")
                 logger.warning("nec_lookup: table '%s' (normalised '%s') not found", tid, normalised)
             else:
-                output_parts.append(_format_table_as_markdown(table))
+                output_parts.append(markdown)
                 logger.info("nec_lookup: resolved table '%s'", normalised)
 
     return "\n\n".join(output_parts)
@@ -315,6 +366,23 @@ def nec_lookup(section_ids: list[str] | None = None, table_ids: list[str] | None
 # ---------------------------------------------------------------------------
 
 
+def _iter_chapter_lines(chapter: dict):
+    """Yield the outline lines for *chapter*: its heading, then one indented line per article."""
+    yield f"Chapter {chapter['chapter_num']}: {chapter['title']}"
+    for art in chapter["articles"]:
+        yield f"  Article {art['article_num']}: {art['title']}"
+
+
+@functools.cache
+def _all_chapters_listing() -> str:
+    """Return the no-argument browse listing: every chapter and its articles, blank line after each.
+
+    The NEC structure never changes at runtime, so the string is built once.
+    """
+    chapters = load_nec_navigation()["chapters"]  # pylint: disable=unsubscriptable-object
+    return "\n".join(line for ch in chapters for line in (*_iter_chapter_lines(ch), ""))
+
+
 @tool(parse_docstring=True)
 def browse_nec_structure(chapter: int | None = None, article: int | None = None, part: int | None = None) -> str:
     """Browse the hierarchical structure of the NEC to discover what sections exist.
@@ -343,15 +411,10 @@ def browse_nec_structure(chapter: int | None = None, article: int | None = None,
     Returns:
         str: A plain-text outline of chapters, articles, parts, or subsections depending on the specificity of the arguments.
     """
-    data = load_structured_json()
-    chapters = data["chapters"]  # pylint: disable=unsubscriptable-object
-
-    # Build lookup dicts for fast navigation
-    chapter_by_num = {ch["chapter_num"]: ch for ch in chapters}
-    article_by_num: dict[int, dict] = {}
-    for ch in chapters:
-        for art in ch["articles"]:
-            article_by_num[art["article_num"]] = art
+    # Chapter/article lookup dicts, built once on first use
+    nav = load_nec_navigation()
+    chapter_by_num = nav["chapter_by_num"]  # pylint: disable=unsubscriptable-object
+    article_by_num = nav["article_by_num"]  # pylint: disable=unsubscriptable-object
 
     # --- Article + optional part: show subsection outline ---
     if article is not None:
@@ -368,7 +431,7 @@ def browse_nec_structure(chapter: int | None = None, article: int | None = None,
                 return f"Error: Part {part} not found in Article {article}. Valid parts: {sorted(set(valid_ints))}"
 
         logger.info("browse_nec_structure: article=%d  part=%s", article, part)
-        return _format_article_outline(art, part_filter=part)
+        return cached_article_outline(article, part_filter=part)
 
     # --- Chapter only: list articles ---
     if chapter is not None:
@@ -377,17 +440,8 @@ def browse_nec_structure(chapter: int | None = None, article: int | None = None,
             return f"Error: Chapter {chapter} not found. Valid chapters: {sorted(chapter_by_num.keys())}"
 
         logger.info("browse_nec_structure: chapter=%d", chapter)
-        lines = [f"Chapter {ch['chapter_num']}: {ch['title']}"]
-        for art in ch["articles"]:
-            lines.append(f"  Article {art['article_num']}: {art['title']}")
-        return "\n".join(lines)
+        return "\n".join(_iter_chapter_lines(ch))
 
     # --- No args: list all chapters and their articles ---
     logger.info("browse_nec_structure: listing all chapters")
-    lines = []
-    for ch in chapters:
-        lines.append(f"Chapter {ch['chapter_num']}: {ch['title']}")
-        for art in ch["articles"]:
-            lines.append(f"  Article {art['article_num']}: {art['title']}")
-        lines.append("")
-    return "\n".join(lines)
+    return _all_chapters_listing()
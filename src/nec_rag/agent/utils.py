@@ -1,14 +1,49 @@
-"""Utility helpers for the NEC agent (ID normalisation, retrieval, formatting, structure browsing)."""
+"""Utility helpers for the NEC agent (logging, ID normalisation, retrieval, formatting, structure browsing)."""
 
+import atexit
+import functools
+import heapq
 import logging
+import queue
 import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from difflib import get_close_matches
+from itertools import chain
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Sequence
 
-import chromadb
+from nec_rag.agent.loaders import load_nec_navigation
+
+# Only needed for annotations; importing chromadb costs ~1 s at startup
+if TYPE_CHECKING:
+    import chromadb
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure root logging for the CLI and web entrypoints.
+
+    Records go through a ``QueueHandler`` to a ``QueueListener`` thread that
+    owns the stream handler, so tool calls never block on console I/O.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    # QueueHandler formats records before enqueueing them, so the listener's handler prints them verbatim
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=level, format=_LOG_FORMAT, handlers=[QueueHandler(log_queue)])
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    listener.start()
+    atexit.register(listener.stop)  # flush queued records on exit
+
+
 # ---------------------------------------------------------------------------
 # ID normalisation and fuzzy matching
 # ---------------------------------------------------------------------------
@@ -27,8 +62,33 @@ def normalize_table_id(raw_id: str) -> str:
     return f"Table{bare}"
 
 
-def suggest_similar_ids(query_id: str, valid_ids: list[str], n: int = 5) -> list[str]:
-    """Return up to *n* IDs from *valid_ids* that are close to *query_id*."""
+def _prefix_slice(sorted_ids: Sequence[str], prefix: str) -> Sequence[str]:
+    """Return the contiguous run of *sorted_ids* that start with *prefix* (two bisects)."""
+    lo = bisect_left(sorted_ids, prefix)
+    hi = bisect_left(sorted_ids, prefix + "\uffff", lo)
+    return sorted_ids[lo:hi]
+
+
+def suggest_similar_ids(query_id: str, valid_ids: Sequence[str], n: int = 5) -> list[str]:
+    """Return up to *n* IDs from *valid_ids* that are close to *query_id*.
+
+    Fuzzy matching every NEC ID costs ~150 ms, so candidates are first
+    narrowed with bisect to IDs sharing the query's article prefix (e.g.
+    ``"250."`` or ``"Table310."``).  When that block yields *n* matches they
+    are returned as they are, ranked only against each other: a sibling in
+    the same article is the better "did you mean" even if an ID elsewhere
+    scores higher.  Otherwise the whole list is ranked as one.
+
+    Precondition: *valid_ids* must be sorted, or the bisect silently picks
+    the wrong block.  It is not re-checked here, since that would be a full
+    scan per call; callers pass ``load_sorted_section_ids()`` or
+    ``load_sorted_table_ids()``, which are sorted once when built.
+    """
+    head, dot, _ = query_id.partition(".")
+    if dot:
+        matches = get_close_matches(query_id, _prefix_slice(valid_ids, head + dot), n=n, cutoff=0.4)
+        if len(matches) >= n:
+            return matches
     return get_close_matches(query_id, valid_ids, n=n, cutoff=0.4)
 
 
@@ -37,20 +97,38 @@ def suggest_similar_ids(query_id: str, valid_ids: list[str], n: int = 5) -> list
 # ---------------------------------------------------------------------------
 
 
-def _retrieve(query: str, embed_fn, collection: chromadb.Collection, n_results: int = 20) -> list[dict]:
-    """Embed the query and retrieve the top-N most relevant subsections."""
-    query_embedding = embed_fn(query)
+def _retrieve(query: str, embed_fn, collection: "chromadb.Collection", n_results: int = 20, query_embedding=None) -> list[dict]:
+    """Embed the query and retrieve the top-N most relevant subsections.
+
+    Pass *query_embedding* when the caller has already embedded *query* to
+    skip the second ``embed_fn`` call.
+    """
+    if query_embedding is None:
+        query_embedding = embed_fn(query)
+    return _retrieve_batch([query], embed_fn, collection, n_results=n_results, query_embeddings=[query_embedding])[0]
+
+
+def _retrieve_batch(queries: Sequence[str], embed_fn, collection: "chromadb.Collection", n_results: int = 20, query_embeddings=None) -> list[list[dict]]:
+    """Retrieve the top-N subsections for each of *queries* with a single collection query.
+
+    The queries are embedded concurrently, so the Azure embedding batcher can
+    coalesce them into one API request.  Returns one result list per query,
+    in the same order and format as :func:`_retrieve`.
+    """
+    if query_embeddings is None:
+        with ThreadPoolExecutor(max_workers=min(16, len(queries)) or 1) as pool:
+            query_embeddings = list(pool.map(embed_fn, queries))
     results = collection.query(
-        query_embeddings=[query_embedding],
+        query_embeddings=list(query_embeddings),
         n_results=n_results,
         include=["documents", "metadatas", "distances"],
     )
 
-    # Unpack ChromaDB nested-list structure (single query -> index 0)
-    retrieved = []
-    for doc, meta, dist in zip(results["documents"][0], results["metadatas"][0], results["distances"][0]):
-        retrieved.append({"document": doc, "metadata": meta, "distance": dist})
-    return retrieved
+    # Unpack ChromaDB nested-list structure (one inner list per query)
+    return [
+        [{"document": doc, "metadata": meta, "distance": dist} for doc, meta, dist in zip(docs, metas, dists)]
+        for docs, metas, dists in zip(results["documents"], results["metadatas"], results["distances"])
+    ]
 
 
 def _rerank(query: str, retrieved: list[dict], cross_encoder, top_n_rerank: int = 10, top_n_embed: int = 5) -> list[dict]:
@@ -70,26 +148,14 @@ def _rerank(query: str, retrieved: list[dict], cross_encoder, top_n_rerank: int
     pairs = [(query, item["document"]) for item in retrieved]
     scores = cross_encoder.predict(pairs)
 
-    # Indices of top-N by re-rank score (descending)
-    scored_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
-    rerank_indices = scored_indices[:top_n_rerank]
+    # Indices of top-N by re-rank score (descending); a partial sort is enough
+    rerank_indices = heapq.nlargest(top_n_rerank, range(len(scores)), key=scores.__getitem__)
 
     # Indices of top-N by embedding distance (already in order from _retrieve)
     embed_indices = list(range(min(top_n_embed, len(retrieved))))
 
-    # Union: re-ranked first, then embedding-only extras
-    seen: set[int] = set()
-    merged_indices: list[int] = []
-    for idx in rerank_indices:
-        if idx not in seen:
-            merged_indices.append(idx)
-            seen.add(idx)
-    for idx in embed_indices:
-        if idx not in seen:
-            merged_indices.append(idx)
-            seen.add(idx)
-
-    merged = [retrieved[i] for i in merged_indices]
+    # Union: re-ranked first, then embedding-only extras (dict keys keep insertion order)
+    merged = [retrieved[i] for i in dict.fromkeys([*rerank_indices, *embed_indices])]
     logger.info(
         "_rerank: %d candidates scored, returning %d (top-%d rerank + top-%d embed, %d overlap)",
         len(retrieved),
@@ -149,18 +215,13 @@ def _build_context(retrieved: list[dict]) -> str:
 
 def _format_table_as_markdown(table: dict) -> str:
     """Render a structured table dict as a readable markdown table with footnotes."""
-    lines = [f"**{table['title']}**"]
-
     headers = table["column_headers"]
-    if headers:
-        lines.append("| " + " | ".join(headers) + " |")
-        lines.append("| " + " | ".join("---" for _ in headers) + " |")
-        for row in table["data_rows"]:
-            lines.append("| " + " | ".join(row) + " |")
-
-    for footnote in table.get("footnotes", []):
-        lines.append(f"> {footnote}")
-
+    grid = (headers, ["---"] * len(headers), *table["data_rows"]) if headers else ()
+    lines = (
+        f"**{table['title']}**",
+        *("| " + " | ".join(cells) + " |" for cells in grid),
+        *(f"> {footnote}" for footnote in table.get("footnotes", [])),
+    )
     return "\n".join(lines)
 
 
@@ -171,18 +232,7 @@ def _format_table_as_markdown(table: dict) -> str:
 
 def _build_subsection_text(subsection: dict) -> str:
     """Assemble a subsection's full text from front_matter and sub_items."""
-    parts = [subsection["front_matter"]]
-    for item in subsection.get("sub_items", []):
-        parts.append(item["content"])
-    return "\n".join(parts)
-
-
-def _build_subsection_full_text(subsection: dict) -> str:
-    """Assemble the full text for a subsection from its front_matter and sub_items."""
-    parts = [subsection["front_matter"]]
-    for item in subsection.get("sub_items", []):
-        parts.append(item["content"])
-    return "\n".join(parts)
+    return "\n".join(chain((subsection["front_matter"],), (item["content"] for item in subsection.get("sub_items", ()))))
 
 
 # ---------------------------------------------------------------------------
@@ -198,7 +248,7 @@ def _find_scope_subsection(article: dict) -> str | None:
     for part in article["parts"]:
         for subsection in part["subsections"]:
             if subsection["id"] == scope_id:
-                return _build_subsection_full_text(subsection)
+                return _build_subsection_text(subsection)
     return None
 
 
@@ -237,3 +287,15 @@ def _format_article_outline(article: dict, part_filter: int | None = None) -> st
         lines.append(scope_text)
 
     return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=256)
+def cached_article_outline(article_num: int, part_filter: int | None = None) -> str:
+    """Return :func:`_format_article_outline` for *article_num*, memoised per (article, part).
+
+    The structured JSON never changes at runtime and the agent often browses
+    the same article several times in a session, so repeat calls are a
+    dict lookup instead of a walk over every subsection.
+    """
+    article = load_nec_navigation()["article_by_num"][article_num]  # pylint: disable=unsubscriptable-object
+    return _format_article_outline(article, part_filter=part_filter)
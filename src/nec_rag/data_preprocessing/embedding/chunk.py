@@ -9,14 +9,16 @@ Table chunks use a compact 'text' (title + column headers) for embedding,
 and a full markdown 'document' for context display.
 """
 
-import json
 import logging
 import re
-from pathlib import Path
+from itertools import chain
+
+import orjson
+
+from nec_rag.paths import ROOT
 
 logger = logging.getLogger(__name__)
 
-ROOT = Path(__file__).parent.parent.parent.parent.parent.resolve()
 STRUCTURED_JSON_PATH = ROOT / "data" / "prepared" / "NFPA 70 NEC 2023_structured.json"
 
 # Subsections longer than this are split at lettered boundaries (A), (B), etc.
@@ -27,10 +29,7 @@ _LETTERED_RE = re.compile(r"^\([A-Z]\)\s")
 
 def _build_subsection_text(subsection: dict) -> str:
     """Assemble the full text for a subsection from its front_matter and sub_items."""
-    parts = [subsection["front_matter"]]
-    for item in subsection.get("sub_items", []):
-        parts.append(item["content"])
-    return "\n".join(parts)
+    return "\n".join(chain((subsection["front_matter"],), (item["content"] for item in subsection.get("sub_items", ()))))
 
 
 def _iter_subsections(data: dict):
@@ -237,8 +236,8 @@ def chunk_tables(data: dict) -> list[dict]:
 def load_and_chunk() -> list[dict]:
     """Load the structured JSON from disk and return subsection + table chunks."""
     logger.info("Loading structured JSON from %s", STRUCTURED_JSON_PATH)
-    with open(STRUCTURED_JSON_PATH, "r", encoding="utf-8") as fopen:
-        data = json.load(fopen)
+    with open(STRUCTURED_JSON_PATH, "rb") as fopen:
+        data = orjson.loads(fopen.read())
     return chunk_subsections(data) + chunk_tables(data)
 
 
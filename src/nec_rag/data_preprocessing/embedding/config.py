@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-ROOT = Path(__file__).parent.parent.parent.parent.parent.resolve()
+from nec_rag.paths import ROOT
 
 COLLECTION_NAME = "nec_subsections"
 
@@ -17,7 +17,7 @@ MODELS = {
         "display_name": "text-embedding-3-large",
         "type": "azure",
         "chroma_dir": "text-embedding-3-large",
-        "batch_size": 50,
+        "batch_size": 256,  # API accepts up to 2048 inputs per request
     },
 }
 
@@ -16,6 +16,7 @@ import os
 import time
 
 import chromadb
+import numpy as np
 from dotenv import load_dotenv
 from tqdm import tqdm
 
@@ -95,6 +96,14 @@ def _embed_azure_large(texts: list[str], batch_size: int) -> list[list[float]]:
     return all_embeddings
 
 
+def _normalise_rows(embeddings: list[list[float]]) -> list[list[float]]:
+    """L2-normalise each embedding so cosine similarity reduces to a dot product."""
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).tolist()
+
+
 def embed_for_model(model_key: str, chunks: list[dict], reset: bool = False):
     """Run the full embed-and-store pipeline for a single model."""
     model_cfg = MODELS[model_key]
@@ -127,6 +136,8 @@ def embed_for_model(model_key: str, chunks: list[dict], reset: bool = False):
     else:
         raise ValueError(f"Unknown model type: {model_cfg['type']}")
 
+    all_embeddings = _normalise_rows(all_embeddings)
+
     elapsed_embed = time.time() - t0
     logger.info("Embedding complete in %.1f seconds (%.1f chunks/sec)", elapsed_embed, len(embed_texts) / elapsed_embed)
 
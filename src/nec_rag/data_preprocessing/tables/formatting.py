@@ -10,20 +10,19 @@ import json
 import logging
 import os
 import time
-from pathlib import Path
 
 from dotenv import load_dotenv
 from openai import OpenAI
 
 from nec_rag.data_preprocessing.tables.classifiers import get_table_id
 from nec_rag.data_preprocessing.tables.schema import TableStructure
+from nec_rag.paths import ROOT
 
 logger = logging.getLogger(__name__)
 
 
-# ─── Project Root & Environment ───────────────────────────────────────────────
+# ─── Environment ─────────────────────────────────────────────────────────────
 
-ROOT = Path(__file__).parent.parent.parent.parent.parent.resolve()
 load_dotenv(ROOT / ".env")
 
 
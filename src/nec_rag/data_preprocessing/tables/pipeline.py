@@ -11,7 +11,6 @@ merge heuristic.
 
 import json
 import logging
-from pathlib import Path
 
 from nec_rag.data_preprocessing.tables.classifiers import get_table_id
 from nec_rag.data_preprocessing.tables.detection import (
@@ -21,11 +20,10 @@ from nec_rag.data_preprocessing.tables.detection import (
     find_table_starts,
 )
 from nec_rag.data_preprocessing.tables.formatting import format_table
+from nec_rag.paths import ROOT
 
 logger = logging.getLogger(__name__)
 
-ROOT = Path(__file__).parent.parent.parent.parent.parent.resolve()
-
 
 # ─── Dict Utility ────────────────────────────────────────────────────────────
 
@@ -0,0 +1,29 @@
+"""Shared ``__main__`` driver for running a single cleaning step on its own.
+
+Each step module (``hyphens_endline``, ``remove_junk_pages``,
+``sentence_runover``) can be run directly to apply just that step to the raw
+OCR paragraphs; the full pipeline lives in ``clean.py``.
+"""
+
+from typing import Callable
+
+import orjson
+
+from nec_rag.paths import ROOT
+
+PARAGRAPHS_FILE = ROOT / "data" / "raw" / "NFPA 70 NEC 2023_paragraphs.json"
+OUTPUT_FILE = ROOT / "data" / "intermediate" / "NFPA 70 NEC 2023_cleaned_paragraphs.json"
+
+
+def run_step_on_raw_paragraphs(run: Callable[[dict], dict]) -> None:
+    """Apply the cleaning step *run* to the raw paragraphs JSON and write the result."""
+    # Read in big paragraphs file
+    with open(PARAGRAPHS_FILE, "rb") as fopen:
+        paragraphs = orjson.loads(fopen.read())
+
+    # Run cleaning
+    output = run(paragraphs)
+
+    # Output
+    with open(OUTPUT_FILE, "wb") as fopen:
+        fopen.write(orjson.dumps(output))
@@ -17,19 +17,20 @@ Usage:
   python -m nec_rag.data_preprocessing.text_cleaning.clean
 """
 
-import json
 import logging
 from pathlib import Path
 
+import orjson
+
 from nec_rag.data_preprocessing.tables import pipeline as tables
 from nec_rag.data_preprocessing.text_cleaning import hyphens_endline, remove_junk_pages, remove_page_furniture, sentence_runover
+from nec_rag.paths import ROOT
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 # Resolve paths
-ROOT = Path(__file__).parent.parent.parent.parent.parent.resolve()
 PARAGRAPHS_FILE = ROOT / "data" / "raw" / "NFPA 70 NEC 2023_paragraphs.json"
 OUTPUT_DIR = ROOT / "data" / "intermediate"
 
@@ -37,8 +38,8 @@ OUTPUT_DIR = ROOT / "data" / "intermediate"
 def load_paragraphs(filepath: Path = PARAGRAPHS_FILE) -> dict[str, dict]:
     """Load raw paragraph JSON from disk."""
     logger.info("Loading paragraphs from %s", filepath)
-    with open(filepath, "r", encoding="utf-8") as fopen:
-        paragraphs = json.load(fopen)
+    with open(filepath, "rb") as fopen:
+        paragraphs = orjson.loads(fopen.read())
     logger.info("Loaded %d paragraphs", len(paragraphs))
     return paragraphs
 
@@ -57,17 +58,30 @@ def run_cleaning_pipeline(paragraphs: dict[str, dict]) -> dict[str, dict]:
     output = sentence_runover.run(output)
     logger.info("After sentence_runover: %d paragraphs", len(output))
 
-    # Step 4: Remove end-of-line hyphenation artifacts
-    output = hyphens_endline.run(output)
-    logger.info("After hyphens_endline: %d paragraphs", len(output))
-
-    # Step 5: Remove page headers, footers, copyright, watermarks, etc.
-    output = remove_page_furniture.run(output)
-    logger.info("After remove_page_furniture: %d paragraphs", len(output))
+    # Steps 4-5: Remove end-of-line hyphenation artifacts, then page headers,
+    # footers, copyright, watermarks, etc. -- both per-paragraph, so one pass
+    output = dehyphenate_and_strip_furniture(output)
+    logger.info("After hyphens_endline + remove_page_furniture: %d paragraphs", len(output))
 
     return output
 
 
+def dehyphenate_and_strip_furniture(paragraphs: dict[str, dict]) -> dict[str, dict]:
+    """Apply ``hyphens_endline`` then ``remove_page_furniture`` in a single pass and re-index.
+
+    Equivalent to ``remove_page_furniture.run(hyphens_endline.run(paragraphs))``
+    without materialising and re-sorting the intermediate dict.
+    """
+    kept = []
+    for i in range(len(paragraphs)):
+        content, page = paragraphs[str(i)].values()
+        content = hyphens_endline.fix_hyphens(content)
+        if not remove_page_furniture.is_page_furniture(content):
+            kept.append({"content": content, "page": page})
+    logger.info("Removed %d page-furniture paragraphs", len(paragraphs) - len(kept))
+    return {str(i): paragraph for i, paragraph in enumerate(kept)}
+
+
 def paragraphs_to_text(paragraphs: dict[str, dict]) -> str:
     """Convert paragraph dict to plain text, stripping non-ASCII characters."""
     lines = []
@@ -83,8 +97,8 @@ def save_outputs(paragraphs: dict[str, dict], output_dir: Path) -> None:
     """Write cleaned paragraphs as JSON and plain text."""
     # Save cleaned JSON (with page numbers)
     json_file = output_dir / "NFPA 70 NEC 2023_clean.json"
-    with open(json_file, "w", encoding="utf-8") as fopen:
-        json.dump(paragraphs, fopen)
+    with open(json_file, "wb") as fopen:
+        fopen.write(orjson.dumps(paragraphs))
     logger.info("Wrote cleaned JSON to %s", json_file)
 
     # Save cleaned plain text
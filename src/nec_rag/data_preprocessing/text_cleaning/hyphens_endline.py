@@ -4,6 +4,13 @@ import re
 
 # Matches a letter followed by '- ' (hyphen-space), indicating a broken word
 HYPHEN_PATTERN = r"[A-Za-z]- "
+HYPHEN_RE = re.compile(HYPHEN_PATTERN)
+
+
+def fix_hyphens(content: str) -> str:
+    """Join words broken across lines, e.g. 'electri- cal' -> 'electrical'."""
+    # Does nothing to strings with no match
+    return HYPHEN_RE.sub(lambda m: m.group(0)[0], content)
 
 
 def run(paragraphs: dict[str, dict]) -> dict[str, dict]:
@@ -12,29 +19,12 @@ def run(paragraphs: dict[str, dict]) -> dict[str, dict]:
     new_output = {}
     for i in range(len(paragraphs)):
         content, page = paragraphs[str(i)].values()
-
-        # Call re.sub to sub in new text for old -- does nothing to strings with no match
-        new_content = re.sub(HYPHEN_PATTERN, lambda m: m.group(0)[0], content)
-
-        new_output[str(i)] = {"content": new_content, "page": page}
+        new_output[str(i)] = {"content": fix_hyphens(content), "page": page}
 
     return new_output
 
 
 if __name__ == "__main__":
-    import json
-    from pathlib import Path
-
-    # Read in big paragraphs file
-    root = Path(__file__).parent.parent.parent.parent.parent.resolve()
-    PARAGRAPHS_FILE = root / "data" / "raw" / "NFPA 70 NEC 2023_paragraphs.json"
-    with open(PARAGRAPHS_FILE, "r", encoding="utf-8") as fopen:
-        paragraphs = json.load(fopen)
-
-    # Run cleaning
-    output = run(paragraphs)
-
-    # Output
-    OUTPUT_FILE = root / "data" / "intermediate" / "NFPA 70 NEC 2023_cleaned_paragraphs.json"
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as fopen:
-        json.dump(output, fopen)
+    from nec_rag.data_preprocessing.text_cleaning._io import run_step_on_raw_paragraphs
+
+    run_step_on_raw_paragraphs(run)
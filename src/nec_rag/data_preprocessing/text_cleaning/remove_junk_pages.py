@@ -27,19 +27,6 @@ def run(paragraphs: dict[str, dict[str, str | int]]) -> dict[str, dict]:
 
 
 if __name__ == "__main__":
-    import json
-    from pathlib import Path
-
-    # Read in big paragraphs file
-    root = Path(__file__).parent.parent.parent.parent.parent.resolve()
-    PARAGRAPHS_FILE = root / "data" / "raw" / "NFPA 70 NEC 2023_paragraphs.json"
-    with open(PARAGRAPHS_FILE, "r", encoding="utf-8") as fopen:
-        paragraphs = json.load(fopen)
-
-    # Run cleaning
-    output = run(paragraphs)
-
-    # Output
-    OUTPUT_FILE = root / "data" / "intermediate" / "NFPA 70 NEC 2023_cleaned_paragraphs.json"
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as fopen:
-        json.dump(output, fopen)
+    from nec_rag.data_preprocessing.text_cleaning._io import run_step_on_raw_paragraphs
+
+    run_step_on_raw_paragraphs(run)
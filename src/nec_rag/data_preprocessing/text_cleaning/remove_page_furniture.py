@@ -62,6 +62,10 @@ CHAPTER_TITLE_RE = re.compile(r"^Chapter \d+ [A-Z]")
 # Bare section number at page top, e.g. "110.26" (2+ digits before dot)
 SECTION_NUM_ONLY_RE = re.compile(r"^\d{2,}\.\d+$")
 
+# Union of the unconditional patterns above, so each paragraph is scanned once.
+# The article header is kept separate because it also requires an all-caps line.
+FURNITURE_RE = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in (PAGE_NUM_RE, CHAPTER_CAPS_RE, CHAPTER_TITLE_RE, SECTION_NUM_ONLY_RE)))
+
 
 def is_page_furniture(content: str) -> bool:
     """Return True if the paragraph is page furniture that should be removed.
@@ -73,19 +77,14 @@ def is_page_furniture(content: str) -> bool:
         return True
 
     # Prefix-based checks: copyright notice
-    if any(content.startswith(prefix) for prefix in COPYRIGHT_PREFIXES):
+    if content.startswith(COPYRIGHT_PREFIXES):
         return True
 
-    # Regex-based checks: page numbers, article headers, chapter markers,
-    # chapter titles, and bare section-number repeats
-    checks = [
-        PAGE_NUM_RE.match(content),
-        ARTICLE_HEADER_CAPS_RE.match(content) and content.isupper(),
-        CHAPTER_CAPS_RE.match(content),
-        CHAPTER_TITLE_RE.match(content),
-        SECTION_NUM_ONLY_RE.match(content),
-    ]
-    return any(checks)
+    # Regex-based checks: page numbers, chapter markers, chapter titles and
+    # bare section-number repeats in one scan, then all-caps article headers
+    if FURNITURE_RE.match(content):
+        return True
+    return content.isupper() and ARTICLE_HEADER_CAPS_RE.match(content) is not None
 
 
 def run(paragraphs: dict[str, dict]) -> dict[str, dict]:
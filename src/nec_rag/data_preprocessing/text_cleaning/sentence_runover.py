@@ -1,5 +1,13 @@
 """Merge sentences that were split across page boundaries by the OCR process."""
 
+import re
+
+# A numeric first word such as "290.98" or "240" (what float() would accept, minus nan/inf)
+_NUMBER_RE = re.compile(r"[+-]?(?:\d[\d_]*(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Words that open a new structural element rather than continuing a sentence
+_STRUCTURAL_PREFIXES = ("(", "Informational", "Part", "Table", "Figure")
+
 
 def sentence_runs_over(p1: str, p2: str) -> bool:
     """Determine whether text at the end of one page continues into the next.
@@ -8,12 +16,8 @@ def sentence_runs_over(p1: str, p2: str) -> bool:
     False if p2 starts a new sentence or section.
     """
     # If page 2 starts with e.g. "290.98", it's a new section number
-    first_word = p2.split(" ")[0]
-    try:
-        float(first_word)
+    if _NUMBER_RE.fullmatch(p2.split(" ", 1)[0]):
         return False
-    except ValueError:
-        pass
 
     # If p1 ends with sentence-ending punctuation, it's not a runover
     if p1[-1] in ".?!":
@@ -24,8 +28,7 @@ def sentence_runs_over(p1: str, p2: str) -> bool:
         return False
 
     # If p2 starts with a structural keyword, it's a new section
-    structural_prefixes = ("(", "Informational", "Part", "Table", "Figure")
-    if any(p2.startswith(prefix) for prefix in structural_prefixes):
+    if p2.startswith(_STRUCTURAL_PREFIXES):
         return False
 
     # All-caps lines are headers, not runovers
@@ -43,16 +46,18 @@ def resort_dict(d: dict[str, dict]) -> dict[str, dict]:
 
 def run(paragraphs: dict[str, dict[str, str | int]]) -> dict:
     """Detect and merge sentences split across page boundaries."""
-    # Loop over all paragraphs
-    new_output = paragraphs.copy()
+    # Work on a list in key order; merges and deletions are applied when re-indexing
+    items = [paragraphs[str(i)] for i in range(len(paragraphs))]
+    merged: dict[int, dict] = {}
+    dropped: set[int] = set()
     paragraph_ix_page_stop, paragraph_ix_page_start = 99, 0
     skip_next = False
-    for i in range(len(paragraphs)):
+    for i, paragraph in enumerate(items):
         if skip_next:
             skip_next = False
             continue
 
-        content, page = paragraphs[str(i)].values()
+        content, page = paragraph.values()
 
         # Identify page start/stop markers
         if "article" in content.lower() and content.isupper():
@@ -64,39 +69,27 @@ def run(paragraphs: dict[str, dict[str, str | int]]) -> dict:
 
         # If we hit the start of a new page...
         if paragraph_ix_page_start > paragraph_ix_page_stop:
-            p1 = paragraphs[str(paragraph_ix_page_stop - 1)]["content"]
-            p2 = paragraphs[str(paragraph_ix_page_start + 1)]["content"]
+            p1 = items[paragraph_ix_page_stop - 1]["content"]
+            p2 = items[paragraph_ix_page_start + 1]["content"]
             paragraph_ix_page_start = 0
 
             # and if we have a run-over sentence,
             if sentence_runs_over(p1, p2):
                 # make the sentence whole again, and assign to the first paragraph/page slot
-                new_output[str(paragraph_ix_page_stop - 1)] = {"content": p1 + " " + p2, "page": page - 1}
+                merged[paragraph_ix_page_stop - 1] = {"content": p1 + " " + p2, "page": page - 1}
+                dropped.discard(paragraph_ix_page_stop - 1)
 
                 # Remove tail end of the sentence
-                del new_output[str(i + 1)]
+                dropped.add(i + 1)
+                merged.pop(i + 1, None)
                 skip_next = True
 
-    # Reorder dict with consecutive integer keys
-    new_output = resort_dict(new_output)
-
-    return new_output
+    # Rebuild the dict with consecutive integer keys
+    kept = (merged.get(ix, paragraph) for ix, paragraph in enumerate(items) if ix not in dropped)
+    return {str(new_key): paragraph for new_key, paragraph in enumerate(kept)}
 
 
 if __name__ == "__main__":
-    import json
-    from pathlib import Path
-
-    # Read in big paragraphs file
-    root = Path(__file__).parent.parent.parent.parent.parent.resolve()
-    PARAGRAPHS_FILE = root / "data" / "raw" / "NFPA 70 NEC 2023_paragraphs.json"
-    with open(PARAGRAPHS_FILE, "r", encoding="utf-8") as fopen:
-        paragraphs = json.load(fopen)
-
-    # Run cleaning
-    output = run(paragraphs)
-
-    # Output
-    OUTPUT_FILE = root / "data" / "intermediate" / "NFPA 70 NEC 2023_cleaned_paragraphs.json"
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as fopen:
-        json.dump(output, fopen)
+    from nec_rag.data_preprocessing.text_cleaning._io import run_step_on_raw_paragraphs
+
+    run_step_on_raw_paragraphs(run)
@@ -27,13 +27,10 @@ import re
 from pathlib import Path
 
 from nec_rag.data_preprocessing.text_cleaning import remove_page_furniture
+from nec_rag.paths import ROOT
 
 logger = logging.getLogger(__name__)
 
-# ── Project root ─────────────────────────────────────────────────────────────
-
-ROOT = Path(__file__).parent.parent.parent.parent.parent.resolve()
-
 # ── Regex patterns for structural boundaries ─────────────────────────────────
 
 # "ARTICLE 90 Introduction" or "ARTICLE 660 X-Ray Equipment"
@@ -0,0 +1,8 @@
+"""Filesystem locations shared across the nec_rag package."""
+
+import os
+from pathlib import Path
+
+# Repository root: src/nec_rag/paths.py -> src/nec_rag -> src -> <root>.
+# Plain string operations on the absolute module path; no filesystem access.
+ROOT = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -19,21 +19,22 @@ from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
 from dotenv import load_dotenv
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from langchain_community.callbacks import get_openai_callback
-from langchain_core.messages import AIMessageChunk, HumanMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 from starlette.responses import StreamingResponse
 
 from nec_rag.agent.agent import build_nec_agent
 from nec_rag.agent.loaders import load_section_index, load_table_page_index
-from nec_rag.agent.resources import load_table_index
+from nec_rag.agent.resources import load_answer_cache, load_embedding_resources, load_response_cache, load_table_index
 from nec_rag.agent.tools import IMAGE_EXTENSIONS, get_vision_usage, reset_seen_sections, reset_vision_usage
-from nec_rag.agent.utils import _build_subsection_text, _format_table_as_markdown, normalize_table_id
+from nec_rag.agent.utils import _build_subsection_text, _format_table_as_markdown, configure_logging, normalize_table_id
+from nec_rag.paths import ROOT
 
-ROOT = Path(__file__).parent.parent.parent.parent.resolve()
 load_dotenv(ROOT / ".env")
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,9 @@ UPLOAD_DIR = Path(tempfile.mkdtemp(prefix="nec_uploads_"))
 # Path to static frontend assets
 STATIC_DIR = Path(__file__).parent / "static"
 
+# Embedding model the agent retrieves with; the answer caches are stored per model
+EMBEDDING_MODEL_KEY = os.getenv("NEC_EMBEDDING_MODEL", "azure-large")
+
 # Context window size for the agent LLM (used by the frontend usage wheel)
 CONTEXT_WINDOW = int(os.getenv("CONTEXT_WINDOW_SIZE", "128000"))
 
@@ -263,11 +267,14 @@ def _stream_agent_thread(
     loop.call_soon_threadsafe(event_queue.put_nowait, None)
 
 
-async def _sse_event_generator(agent, messages: list, session_id: str):
+async def _sse_event_generator(agent, messages: list, session_id: str, question_embedding: np.ndarray | None = None, question: str | None = None):
     """Async generator that yields SSE lines from the agent stream.
 
     Spawns the synchronous ``agent.stream()`` in a background thread and
-    bridges events to the async world via an ``asyncio.Queue``.
+    bridges events to the async world via an ``asyncio.Queue``.  If
+    *question* is given, the final answer is stored in the exact-match cache
+    under it (and in the semantic answer cache under *question_embedding*,
+    when that is given too).
     """
     loop = asyncio.get_running_loop()
     event_queue: asyncio.Queue = asyncio.Queue()
@@ -298,6 +305,25 @@ async def _sse_event_generator(agent, messages: list, session_id: str):
         _sessions[session_id] = result_holder["messages"]
         logger.info("Session %s updated — %d messages total", session_id, len(result_holder["messages"]))
 
+        final_message = result_holder["messages"][-1]  # pylint: disable=unsubscriptable-object
+        if question is not None and final_message.type == "ai" and final_message.content:
+            load_response_cache(EMBEDDING_MODEL_KEY).put(question, final_message.content)
+            if question_embedding is not None:
+                load_answer_cache(EMBEDDING_MODEL_KEY).add(question_embedding, final_message.content)
+
+
+async def _cached_answer_events(answer: str):
+    """Yield the SSE events for an answer served from the exact-match or semantic answer cache."""
+    token_info = {
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "llm_calls": 0,
+        "context_window": CONTEXT_WINDOW,
+        "context_used": 0,
+    }
+    yield _sse_line({"type": "final", "response": answer, "token_info": token_info})
+
 
 # ---------------------------------------------------------------------------
 # FastAPI application
@@ -309,7 +335,7 @@ async def lifespan(_app: FastAPI):
     """Pre-warm the NEC agent on server startup."""
     global _AGENT  # pylint: disable=global-statement
     logger.info("Initializing NEC agent (this may take a moment)...")
-    _AGENT = build_nec_agent()
+    _AGENT = build_nec_agent(EMBEDDING_MODEL_KEY)
     logger.info("NEC agent ready — listening for requests.")
     yield
 
@@ -387,12 +413,32 @@ async def chat(
         _sessions[session_id] = []
         logger.info("New session created: %s", session_id)
 
+    # Standalone text-only questions (first turn, no images) can be answered
+    # from the exact-match or semantic answer cache without running the agent
+    question = question_embedding = None
+    if not _sessions[session_id] and not image_paths:
+        question = user_text
+        answer_cache = load_answer_cache(EMBEDDING_MODEL_KEY)
+        cached_answer = await asyncio.to_thread(load_response_cache(EMBEDDING_MODEL_KEY).get, user_text)
+        if cached_answer is None and answer_cache is not None:
+            embed_fn, _ = load_embedding_resources(EMBEDDING_MODEL_KEY)
+            question_embedding = await asyncio.to_thread(embed_fn, user_text)
+            cached_answer = answer_cache.lookup(question_embedding)
+        if cached_answer is not None:
+            _sessions[session_id].extend([HumanMessage(content=user_text), AIMessage(content=cached_answer)])
+            logger.info("Session %s answered from answer cache", session_id)
+            return StreamingResponse(
+                _cached_answer_events(cached_answer),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
     # Append the user message to conversation history
     _sessions[session_id].append(HumanMessage(content=user_text))
 
     # Stream SSE events as the agent thinks and calls tools
     return StreamingResponse(
-        _sse_event_generator(_AGENT, _sessions[session_id], session_id),
+        _sse_event_generator(_AGENT, _sessions[session_id], session_id, question_embedding, question),
         media_type="text/event-stream",
         headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
@@ -534,8 +580,7 @@ def main():
     """Start the web server via uvicorn."""
     import uvicorn  # pylint: disable=import-outside-toplevel
 
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    configure_logging()
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
 
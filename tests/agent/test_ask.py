@@ -1,11 +1,19 @@
-"""Unit tests for the agent tools module.
+"""Unit tests for the CLI agent (nec_rag.agent.agent) and the context builder it relies on.
 
-Only _build_context() is testable without mocking -- all other functions
-require Azure OpenAI, ChromaDB, or embedding model access.
+Only _build_context() and the CLI helpers are covered -- building and
+invoking the agent itself requires Azure OpenAI, ChromaDB, or embedding
+model access.
 """
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from nec_rag.agent import agent as agent_module
+from nec_rag.agent.agent import _detect_image_paths
 from nec_rag.agent.utils import _build_context as build_context
 
 
@@ -61,3 +69,55 @@ class TestBuildContext:
     def test_empty_results(self):
         result = build_context([])
         assert result == ""
+
+
+class TestDetectImagePaths:
+
+    def test_plain_question_has_no_images(self):
+        assert not _detect_image_paths("What size conductor is required for a 200A service?")
+
+    def test_existing_image_is_detected(self, tmp_path):
+        image = tmp_path / "Panel.JPG"
+        image.write_bytes(b"")
+        assert _detect_image_paths(f"Is this panel compliant? {image}") == [str(image.resolve())]
+
+    def test_missing_image_is_ignored(self, tmp_path):
+        assert not _detect_image_paths(f"See {tmp_path / 'missing.png'}")
+
+
+class TestBuildNecAgentInBackground:
+
+    def test_resolves_to_the_built_agent_on_a_daemon_thread(self, monkeypatch):
+        threads = []
+        monkeypatch.setattr(agent_module, "build_nec_agent", lambda embedding_model_key: threads.append(threading.current_thread()) or embedding_model_key)
+        assert agent_module._build_nec_agent_in_background("qwen3").result(timeout=5) == "qwen3"  # pylint: disable=protected-access
+        assert threads[0].daemon
+
+    def test_build_errors_surface_on_result(self, monkeypatch):
+        def _fail(embedding_model_key):
+            raise RuntimeError(embedding_model_key)
+
+        monkeypatch.setattr(agent_module, "build_nec_agent", _fail)
+        with pytest.raises(RuntimeError, match="qwen3"):
+            agent_module._build_nec_agent_in_background("qwen3").result(timeout=5)  # pylint: disable=protected-access
+
+
+class TestAnswerFromCache:
+
+    def test_exact_match_skips_embedding(self):
+        embedded = []
+        response_cache = SimpleNamespace(get=lambda question: "cached")
+        answer = agent_module._answer_from_cache("q", response_cache, SimpleNamespace(), embedded.append)  # pylint: disable=protected-access
+        assert answer == ("cached", None)
+        assert not embedded
+
+    def test_disabled_semantic_cache_skips_embedding(self):
+        embedded = []
+        response_cache = SimpleNamespace(get=lambda question: None)
+        assert agent_module._answer_from_cache("q", response_cache, None, embedded.append) == (None, None)  # pylint: disable=protected-access
+        assert not embedded
+
+    def test_semantic_lookup_returns_embedding(self):
+        response_cache = SimpleNamespace(get=lambda question: None)
+        answer_cache = SimpleNamespace(lookup=lambda embedding: f"near {embedding}")
+        assert agent_module._answer_from_cache("q", response_cache, answer_cache, lambda text: text.upper()) == ("near Q", "Q")  # pylint: disable=protected-access
@@ -0,0 +1,219 @@
+"""Unit tests for the agent's query caches."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import time
+
+import numpy as np
+
+from nec_rag.agent.cache import EmbeddingDiskCache, MemoryEmbeddingCache, ResponseCache, SemanticCache, cache_key, l2_normalise
+
+REAL_TIME = time.time
+
+
+class TestCacheKey:
+
+    def test_is_deterministic(self):
+        assert cache_key("model", "question") == cache_key("model", "question")
+
+    def test_model_is_part_of_key(self):
+        assert cache_key("model-a", "question") != cache_key("model-b", "question")
+
+    def test_parts_are_separated(self):
+        assert cache_key("ab", "c") != cache_key("a", "bc")
+
+
+class TestL2Normalise:
+
+    def test_scales_to_unit_length(self):
+        result = l2_normalise([3.0, 4.0])
+        assert result.dtype == np.float32
+        assert np.allclose(result, [0.6, 0.8])
+
+    def test_zero_vector_is_unchanged(self):
+        assert l2_normalise([0.0, 0.0]).tolist() == [0.0, 0.0]
+
+
+class TestEmbeddingDiskCache:
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = EmbeddingDiskCache(tmp_path, "model")
+        assert cache.get("unseen question") is None
+
+    def test_put_then_get_round_trips(self, tmp_path):
+        cache = EmbeddingDiskCache(tmp_path, "model")
+        cache.put("question", np.array([0.5, -0.25, 1.0], dtype=np.float32))
+        result = cache.get("question")
+        assert result.dtype == np.float32
+        assert result.tolist() == [0.5, -0.25, 1.0]
+
+    def test_persists_across_instances(self, tmp_path):
+        EmbeddingDiskCache(tmp_path, "model").put("question", np.array([1.0, 2.0]))
+        assert EmbeddingDiskCache(tmp_path, "model").get("question").tolist() == [1.0, 2.0]
+
+    def test_different_models_do_not_collide(self, tmp_path):
+        EmbeddingDiskCache(tmp_path, "model-a").put("question", np.array([1.0]))
+        assert EmbeddingDiskCache(tmp_path, "model-b").get("question") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = EmbeddingDiskCache(tmp_path, "model", max_entries=2)
+        cache.put("old", np.array([1.0]))
+        cache.put("newer", np.array([2.0]))
+        # Age the first entry so it is the eviction candidate
+        with cache._conn:  # pylint: disable=protected-access
+            cache._conn.execute("UPDATE emb SET last_used = 0 WHERE key = ?", (cache_key("model", "old"),))  # pylint: disable=protected-access
+        cache.put("newest", np.array([3.0]))
+
+        assert cache.get("old") is None
+        assert cache.get("newer").tolist() == [2.0]
+        assert cache.get("newest").tolist() == [3.0]
+
+    def test_wrap_calls_embed_fn_once_per_text(self, tmp_path):
+        calls = []
+
+        def fake_embed(text):
+            calls.append(text)
+            return np.array([float(len(text))], dtype=np.float32)
+
+        embed = EmbeddingDiskCache(tmp_path, "model").wrap(fake_embed)
+        assert embed("abc").tolist() == [3.0]
+        assert embed("abc").tolist() == [3.0]
+        assert calls == ["abc"]
+
+
+class TestSemanticCache:
+
+    def test_empty_cache_misses(self):
+        assert SemanticCache().lookup([1.0, 0.0]) is None
+
+    def test_exact_vector_hits(self):
+        cache = SemanticCache()
+        cache.add([1.0, 0.0, 0.0], "answer")
+        assert cache.lookup([1.0, 0.0, 0.0]) == "answer"
+
+    def test_scaled_vector_hits(self):
+        """Cosine similarity ignores magnitude."""
+        cache = SemanticCache()
+        cache.add([1.0, 1.0, 0.0], "answer")
+        assert cache.lookup([3.0, 3.0, 0.0]) == "answer"
+
+    def test_dissimilar_vector_misses(self):
+        cache = SemanticCache(threshold=0.97)
+        cache.add([1.0, 0.0, 0.0], "answer")
+        assert cache.lookup([0.0, 1.0, 0.0]) is None
+
+    def test_returns_closest_entry(self):
+        cache = SemanticCache(threshold=0.9)
+        cache.add([1.0, 0.0], "x-axis")
+        cache.add([0.0, 1.0], "y-axis")
+        assert cache.lookup([0.1, 1.0]) == "y-axis"
+
+    def test_oldest_entry_dropped_when_full(self):
+        cache = SemanticCache(max_entries=2)
+        cache.add([1.0, 0.0, 0.0], "first")
+        cache.add([0.0, 1.0, 0.0], "second")
+        cache.add([0.0, 0.0, 1.0], "third")
+        assert len(cache) == 2
+        assert cache.lookup([1.0, 0.0, 0.0]) is None
+        assert cache.lookup([0.0, 0.0, 1.0]) == "third"
+
+    def test_persists_across_instances(self, tmp_path):
+        SemanticCache(cache_dir=tmp_path).add([0.6, 0.8], "saved answer")
+        reloaded = SemanticCache(cache_dir=tmp_path)
+        assert len(reloaded) == 1
+        assert reloaded.lookup([0.6, 0.8]) == "saved answer"
+
+    def test_persisted_cache_respects_capacity_after_eviction(self, tmp_path):
+        cache = SemanticCache(max_entries=1, cache_dir=tmp_path)
+        cache.add([1.0, 0.0], "first")
+        cache.add([0.0, 1.0], "second")
+        reloaded = SemanticCache(max_entries=1, cache_dir=tmp_path)
+        assert len(reloaded) == 1
+        assert reloaded.lookup([0.0, 1.0]) == "second"
+
+    def test_expired_entries_never_match(self, monkeypatch):
+        cache = SemanticCache(ttl_days=1)
+        cache.add([1.0, 0.0], "old answer")
+        monkeypatch.setattr(time, "time", lambda: REAL_TIME() + 2 * 86400)
+        assert cache.lookup([1.0, 0.0]) is None
+
+    def test_expired_entries_dropped_on_load(self, tmp_path, monkeypatch):
+        SemanticCache(cache_dir=tmp_path).add([1.0, 0.0], "old answer")
+        monkeypatch.setattr(time, "time", lambda: REAL_TIME() + 2 * 86400)
+        SemanticCache(cache_dir=tmp_path).add([0.0, 1.0], "new answer")
+        reloaded = SemanticCache(cache_dir=tmp_path, ttl_days=1)
+        assert len(reloaded) == 1
+        assert reloaded.lookup([1.0, 0.0]) is None
+        assert reloaded.lookup([0.0, 1.0]) == "new answer"
+
+
+class TestMemoryEmbeddingCache:
+
+    def test_miss_returns_none(self):
+        assert MemoryEmbeddingCache().get("question") is None
+
+    def test_case_and_whitespace_variants_share_an_entry(self):
+        cache = MemoryEmbeddingCache()
+        cache.put("GFCI  requirements\n", [1.0])
+        assert cache.get("gfci requirements") == [1.0]
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryEmbeddingCache(max_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")  # refresh "a" so "b" is the eviction candidate
+        cache.put("c", [3.0])
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert len(cache) == 2
+
+    def test_wrap_calls_embed_fn_once_per_normalised_text(self):
+        calls = []
+
+        def fake_embed(text):
+            calls.append(text)
+            return [1.0]
+
+        embed = MemoryEmbeddingCache().wrap(fake_embed)
+        embed("What is a GFCI?")
+        embed("what is a gfci?")
+        assert calls == ["What is a GFCI?"]
+
+    def test_counts_hits_and_misses(self):
+        cache = MemoryEmbeddingCache()
+        cache.get("a")
+        cache.put("a", [1.0])
+        cache.get(" A ")
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+
+class TestResponseCache:
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = ResponseCache(tmp_path / "responses.sqlite")
+        assert cache.get("What is GFCI?") is None
+        cache.put("What is GFCI?", "answer")
+        assert cache.get("What is GFCI?") == "answer"
+
+    def test_key_ignores_case_and_whitespace(self, tmp_path):
+        cache = ResponseCache(tmp_path / "responses.sqlite")
+        cache.put("What is  GFCI?", "answer")
+        assert cache.get("  what is gfci? ") == "answer"
+
+    def test_context_change_invalidates(self, tmp_path):
+        ResponseCache(tmp_path / "responses.sqlite", context=("prompt-a", "gpt")).put("q", "answer")
+        assert ResponseCache(tmp_path / "responses.sqlite", context=("prompt-b", "gpt")).get("q") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        cache = ResponseCache(tmp_path / "responses.sqlite")
+        cache.put("q", "answer")
+        cache.close()
+        assert ResponseCache(tmp_path / "responses.sqlite").get("q") == "answer"
+
+    def test_expired_rows_are_ignored_and_pruned(self, tmp_path):
+        cache = ResponseCache(tmp_path / "responses.sqlite", ttl_days=0)
+        cache.put("q", "answer")
+        with cache._conn:  # pylint: disable=protected-access
+            cache._conn.execute("UPDATE responses SET created_at = created_at - 10")  # pylint: disable=protected-access
+        assert cache.get("q") is None
+        assert len(ResponseCache(tmp_path / "responses.sqlite", ttl_days=0)) == 0
@@ -0,0 +1,64 @@
+"""Unit tests for the explain_image tool's local checks and image encoding (no LLM calls)."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring,protected-access
+
+import base64
+import os
+
+from nec_rag.agent import tools
+
+
+class TestEncodeImageBase64:
+
+    def test_matches_single_shot_encoding_across_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tools, "_B64_CHUNK_BYTES", 3 * 4)
+        raw = os.urandom(100)
+        path = tmp_path / "photo.png"
+        path.write_bytes(raw)
+        assert tools._encode_image_base64(path) == base64.b64encode(raw).decode("ascii")
+
+    def test_prefix_is_prepended(self, tmp_path):
+        path = tmp_path / "photo.png"
+        path.write_bytes(b"abc")
+        assert tools._encode_image_base64(path, prefix="data:image/png;base64,") == "data:image/png;base64,YWJj"
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.png"
+        path.write_bytes(b"")
+        assert tools._encode_image_base64(path) == ""
+
+
+class TestExplainImageChecks:
+
+    def test_rejects_oversized_image_before_reading(self, tmp_path, monkeypatch):
+        def _fail(_path):
+            raise AssertionError("oversized image should not be encoded")
+
+        monkeypatch.setattr(tools, "_VISION_MAX_IMAGE_BYTES", 10)
+        monkeypatch.setattr(tools, "_encode_image_base64", _fail)
+        path = tmp_path / "big.png"
+        path.write_bytes(b"x" * 11)
+        assert "at most" in tools.explain_image.invoke({"file_path": str(path)})
+
+    def test_missing_file(self, tmp_path):
+        assert "not found" in tools.explain_image.invoke({"file_path": str(tmp_path / "nope.png")})
+
+    def test_path_through_a_file_is_reported(self, tmp_path):
+        (tmp_path / "notes.txt").write_text("x")
+        assert "cannot read" in tools.explain_image.invoke({"file_path": str(tmp_path / "notes.txt" / "photo.png")})
+
+    def test_unreadable_image_is_reported(self, tmp_path):
+        (tmp_path / "folder.png").mkdir()
+        assert "cannot read" in tools.explain_image.invoke({"file_path": str(tmp_path / "folder.png")})
+
+
+class TestImageMimeTypes:
+
+    def test_every_extension_has_a_mime_type(self):
+        assert tools.IMAGE_EXTENSIONS == frozenset(tools.IMAGE_MIME_TYPES)
+        assert tools.IMAGE_MIME_TYPES[".jpg"] == "image/jpeg"
+
+    def test_unsupported_format_lists_extensions(self, tmp_path):
+        path = tmp_path / "scan.bmp"
+        path.write_bytes(b"BM")
+        assert ".png" in tools.explain_image.invoke({"file_path": str(path)})
@@ -0,0 +1,98 @@
+"""Unit tests for the on-disk index cache in nec_rag.agent.loaders."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nec_rag.agent import loaders
+
+
+@pytest.fixture(name="source_json")
+def fixture_source_json(tmp_path, monkeypatch):
+    """Point the loaders at a throwaway structured JSON and cache directory."""
+    source = tmp_path / "structured.json"
+    source.write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(loaders, "STRUCTURED_JSON_PATH", source)
+    monkeypatch.setattr(loaders, "INDEX_CACHE_DIR", tmp_path)
+    return source
+
+
+class TestLoadCachedIndex:
+
+    @pytest.fixture(autouse=True)
+    def _enable_cache(self, monkeypatch):
+        monkeypatch.setenv("NEC_INDEX_PICKLE_CACHE", "1")
+
+    def test_disabled_by_default(self, source_json, tmp_path, monkeypatch):  # pylint: disable=unused-argument
+        monkeypatch.delenv("NEC_INDEX_PICKLE_CACHE")
+        shared = {"a": 1}
+        assert loaders.load_cached_index("idx", lambda: shared) is shared
+        assert not (tmp_path / "idx.pkl").exists()
+
+    def test_builds_and_writes_cache_on_first_call(self, source_json, tmp_path):
+        assert loaders.load_cached_index("idx", lambda: {"a": 1}) == {"a": 1}
+        assert (tmp_path / "idx.pkl").exists()
+        assert (tmp_path / "idx.sig").exists()
+        assert source_json.exists()
+
+    def test_reuses_cache_when_source_unchanged(self, source_json):  # pylint: disable=unused-argument
+        loaders.load_cached_index("idx", lambda: {"a": 1})
+        assert loaders.load_cached_index("idx", lambda: pytest.fail("index should not be rebuilt")) == {"a": 1}
+
+    def test_rebuilds_when_source_changes(self, source_json):
+        loaders.load_cached_index("idx", lambda: {"a": 1})
+        source_json.write_text('{"changed": true}', encoding="utf-8")
+        os.utime(source_json, ns=(0, 0))
+        assert loaders.load_cached_index("idx", lambda: {"b": 2}) == {"b": 2}
+
+    def test_rebuilds_when_pickle_is_corrupt(self, source_json, tmp_path):  # pylint: disable=unused-argument
+        loaders.load_cached_index("idx", lambda: {"a": 1})
+        (tmp_path / "idx.pkl").write_bytes(b"not a pickle")
+        assert loaders.load_cached_index("idx", lambda: {"b": 2}) == {"b": 2}
+
+
+class TestLoadStructuredJsonConcurrency:
+
+    def test_concurrent_first_calls_parse_once(self, source_json, monkeypatch):  # pylint: disable=unused-argument
+        monkeypatch.setattr(loaders, "_structured_json", None)
+        calls = []
+        real_loads = loaders.orjson.loads
+
+        def _slow_loads(raw):
+            calls.append(raw)
+            time.sleep(0.05)
+            return real_loads(raw)
+
+        monkeypatch.setattr(loaders.orjson, "loads", _slow_loads)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: loaders.load_structured_json(), range(4)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+
+class TestLoadSortedSectionIds:
+
+    def test_sorted_once_and_cached(self, monkeypatch):
+        monkeypatch.setattr(loaders, "_section_index", {"250.50": {}, "110.26": {}, "90.1": {}})
+        monkeypatch.setattr(loaders, "_sorted_section_ids", None)
+        ids = loaders.load_sorted_section_ids()
+        assert ids == ("110.26", "250.50", "90.1")
+        assert loaders.load_sorted_section_ids() is ids
+
+
+class TestLoadNecNavigation:
+
+    def test_builds_lookups_once(self, monkeypatch):
+        article = {"article_num": 90, "title": "Introduction"}
+        chapter = {"chapter_num": 1, "title": "General", "articles": [article]}
+        monkeypatch.setattr(loaders, "_structured_json", {"chapters": [chapter]})
+        monkeypatch.setattr(loaders, "_nec_navigation", None)
+        nav = loaders.load_nec_navigation()
+        assert nav["chapter_by_num"] == {1: chapter}
+        assert nav["article_by_num"][90] is article
+        assert loaders.load_nec_navigation() is nav
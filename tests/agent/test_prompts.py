@@ -0,0 +1,49 @@
+"""Unit tests for the prompt resources in nec_rag.agent.prompts."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from nec_rag.agent import prompts
+
+
+class TestAgentSystemPrompt:
+
+    def test_loaded_from_package_data(self):
+        prompt = prompts.get_agent_system_prompt()
+        assert prompt.startswith("You are an expert on the NFPA 70 National Electrical Code")
+        assert prompt == prompt.strip()
+
+    def test_cached_after_first_read(self):
+        assert prompts.get_agent_system_prompt() is prompts.get_agent_system_prompt()
+
+    def test_sha_matches_utf8_bytes(self):
+        assert prompts.get_agent_system_prompt_sha() == hashlib.sha256(prompts.get_agent_system_prompt().encode("utf-8")).hexdigest()
+
+    def test_prompt_stays_within_word_budget(self):
+        # Sent as the prefix of every agent turn; state each rule once rather than restating it
+        assert len(prompts.get_agent_system_prompt().split()) < 600
+
+    def test_prompt_has_no_format_placeholders(self):
+        # Per-call interpolation would change the prefix and defeat provider prompt caching
+        assert "{" not in prompts.get_agent_system_prompt()
+        assert "}" not in prompts.get_agent_system_prompt()
+
+
+class TestVisionSystemPrompt:
+
+    def test_loaded_from_package_data(self):
+        assert prompts.get_vision_system_prompt().startswith("You are an expert electrician")
+
+
+class TestPromptsDefinedOnce:
+
+    @pytest.mark.parametrize("getter", [prompts.get_agent_system_prompt, prompts.get_vision_system_prompt])
+    def test_prompt_text_is_not_duplicated_in_python_source(self, getter):
+        # A second copy in a .py file would drift from (or shadow) the package-data prompt
+        opening = getter()[:80]
+        package_dir = Path(prompts.__file__).parents[2]
+        assert not [path for path in package_dir.rglob("*.py") if opening in path.read_text(encoding="utf-8")]
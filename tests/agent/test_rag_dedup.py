@@ -7,9 +7,12 @@ sections are filtered out on subsequent calls.
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import hashlib
 from unittest.mock import patch
 
-from nec_rag.agent.tools import rag_search, reset_seen_sections
+import numpy as np
+
+from nec_rag.agent.tools import rag_search, reset_rag_cache, reset_seen_sections
 
 
 def _fake_result(section_id: str, text: str = "") -> dict:
@@ -26,6 +29,12 @@ def _fake_result(section_id: str, text: str = "") -> dict:
     }
 
 
+def _fake_embed(text: str) -> np.ndarray:
+    """Deterministic pseudo-random embedding: distinct texts are near-orthogonal."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "little")
+    return np.random.default_rng(seed).standard_normal(256).astype(np.float32)
+
+
 # Shared mock targets
 _PATCH_EMBED = "nec_rag.agent.tools.load_embedding_resources"
 _PATCH_RETRIEVE = "nec_rag.agent.tools._retrieve"
@@ -35,8 +44,9 @@ class TestRagSearchDeduplication:
     """Verify that rag_search filters out sections already returned by prior calls."""
 
     def setup_method(self):
-        """Reset the seen-section set before every test."""
+        """Reset the seen-section set and the result cache before every test."""
         reset_seen_sections()
+        reset_rag_cache()
 
     def test_ab_then_bc_yields_abc_not_abbc(self):
         """Core scenario: (A+B) then (B+C) should produce (A+B) + (C), not (A+B) + (B+C)."""
@@ -44,7 +54,7 @@ class TestRagSearchDeduplication:
         result_b = _fake_result("250.52")
         result_c = _fake_result("110.26")
 
-        with patch(_PATCH_EMBED, return_value=(None, None)), patch(_PATCH_RETRIEVE) as mock_retrieve:
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE) as mock_retrieve:
             # First call returns A + B
             mock_retrieve.return_value = [result_a, result_b]
             context_1 = rag_search.invoke({"user_request": "grounding electrodes"})
@@ -65,7 +75,7 @@ class TestRagSearchDeduplication:
         """The very first rag_search call should never filter anything."""
         results = [_fake_result("250.50"), _fake_result("250.52"), _fake_result("110.26")]
 
-        with patch(_PATCH_EMBED, return_value=(None, None)), patch(_PATCH_RETRIEVE, return_value=results):
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE, return_value=results):
             context = rag_search.invoke({"user_request": "grounding electrodes"})
 
         assert "250.50" in context
@@ -77,7 +87,7 @@ class TestRagSearchDeduplication:
         result_a = _fake_result("250.50")
         result_b = _fake_result("250.52")
 
-        with patch(_PATCH_EMBED, return_value=(None, None)), patch(_PATCH_RETRIEVE) as mock_retrieve:
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE) as mock_retrieve:
             # First call seeds the seen set
             mock_retrieve.return_value = [result_a, result_b]
             rag_search.invoke({"user_request": "first query"})
@@ -94,7 +104,7 @@ class TestRagSearchDeduplication:
         """After reset_seen_sections(), previously seen IDs should be returned again."""
         result_a = _fake_result("250.50")
 
-        with patch(_PATCH_EMBED, return_value=(None, None)), patch(_PATCH_RETRIEVE, return_value=[result_a]):
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE, return_value=[result_a]):
             rag_search.invoke({"user_request": "first invocation"})
 
             # Reset simulates the start of a new agent invocation
@@ -111,7 +121,7 @@ class TestRagSearchDeduplication:
         result_c = _fake_result("110.26")
         result_d = _fake_result("110.14")
 
-        with patch(_PATCH_EMBED, return_value=(None, None)), patch(_PATCH_RETRIEVE) as mock_retrieve:
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE) as mock_retrieve:
             # Call 1: A + B
             mock_retrieve.return_value = [result_a, result_b]
             ctx1 = rag_search.invoke({"user_request": "query 1"})
@@ -146,7 +156,40 @@ class TestRagSearchDeduplication:
 
         # Now rag_search returns a result for 90.1 — it should NOT be filtered
         result_901 = _fake_result("90.1")
-        with patch(_PATCH_EMBED, return_value=(None, None)), patch(_PATCH_RETRIEVE, return_value=[result_901]):
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE, return_value=[result_901]):
             context = rag_search.invoke({"user_request": "scope of the NEC"})
 
         assert "90.1" in context
+
+
+class TestRagSearchCache:
+    """Verify that repeated or paraphrased queries reuse cached retrieval results."""
+
+    def setup_method(self):
+        reset_seen_sections()
+        reset_rag_cache()
+
+    def test_paraphrase_skips_retrieval(self):
+        vector = _fake_embed("grounding")
+        with patch(_PATCH_EMBED, return_value=(lambda _text: vector, None)), patch(_PATCH_RETRIEVE, return_value=[_fake_result("250.50")]) as mock_retrieve:
+            rag_search.invoke({"user_request": "grounding electrodes"})
+            reset_seen_sections()
+            context = rag_search.invoke({"user_request": "electrode grounding"})
+
+        assert mock_retrieve.call_count == 1
+        assert "250.50" in context
+
+    def test_cached_results_are_still_deduplicated(self):
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE, return_value=[_fake_result("250.50")]):
+            rag_search.invoke({"user_request": "grounding electrodes"})
+            context = rag_search.invoke({"user_request": "grounding electrodes"})
+
+        assert "250.50" not in context
+
+    def test_reset_rag_cache_forces_retrieval(self):
+        with patch(_PATCH_EMBED, return_value=(_fake_embed, None)), patch(_PATCH_RETRIEVE, return_value=[_fake_result("250.50")]) as mock_retrieve:
+            rag_search.invoke({"user_request": "grounding electrodes"})
+            reset_rag_cache()
+            rag_search.invoke({"user_request": "grounding electrodes"})
+
+        assert mock_retrieve.call_count == 2
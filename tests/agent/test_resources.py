@@ -0,0 +1,235 @@
+"""Unit tests for helpers in nec_rag.agent.resources that need no Azure access."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring,protected-access
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from nec_rag.agent import resources
+from nec_rag.agent.resources import AzureConfig, InMemoryCollection, _AzureEmbedBatcher
+
+
+class _FakeEmbeddingsClient:
+    """Stands in for AzureOpenAI: embeds each text as [len(text), 0] and records calls."""
+
+    def __init__(self, fail: bool = False, drop: int = 0):
+        self.calls: list = []
+        self.fail = fail
+        self.drop = drop
+        self.embeddings = self
+
+    def create(self, input, model):  # pylint: disable=redefined-builtin,unused-argument
+        self.calls.append(input)
+        if self.fail:
+            raise RuntimeError("boom")
+        texts = input if isinstance(input, list) else [input]
+        # Return items out of order to check the batcher sorts by index
+        data = [SimpleNamespace(index=i, embedding=[float(len(t)), 0.0]) for i, t in enumerate(texts)]
+        return SimpleNamespace(data=list(reversed(data))[self.drop :])
+
+
+class TestAzureEmbedBatcher:
+
+    def test_single_query_sends_plain_string(self):
+        client = _FakeEmbeddingsClient()
+        batcher = _AzureEmbedBatcher(client, "model")
+        result = batcher.embed("abc")
+        assert result.dtype == np.float32
+        assert result.tolist() == [1.0, 0.0]  # L2-normalised
+        assert client.calls == ["abc"]
+
+    def test_concurrent_queries_share_a_request(self):
+        client = _FakeEmbeddingsClient()
+        batcher = _AzureEmbedBatcher(client, "model", window=0.2)
+        texts = ["a" * n for n in range(1, 9)]
+        results: dict[str, list[float]] = {}
+        start = threading.Barrier(len(texts))
+
+        def worker(text):
+            start.wait()
+            results[text] = batcher.embed(text).tolist()
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(results[t] == [1.0, 0.0] for t in texts)
+        assert len(client.calls) < len(texts)
+
+    def test_api_errors_propagate_to_caller(self):
+        batcher = _AzureEmbedBatcher(_FakeEmbeddingsClient(fail=True), "model")
+        with pytest.raises(RuntimeError, match="boom"):
+            batcher.embed("abc")
+
+    def test_short_response_fails_the_caller(self):
+        batcher = _AzureEmbedBatcher(_FakeEmbeddingsClient(drop=1), "model")
+        with pytest.raises(RuntimeError, match="0 vectors for 1 inputs"):
+            batcher.embed("abc")
+
+    def test_bad_embedding_fails_the_caller_and_keeps_the_worker_alive(self, monkeypatch):
+        client = _FakeEmbeddingsClient()
+        batcher = _AzureEmbedBatcher(client, "model")
+        monkeypatch.setattr(resources, "l2_normalise", lambda vector: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            batcher.embed("abc")
+        monkeypatch.undo()
+        assert batcher.embed("abcd").tolist() == [1.0, 0.0]
+
+    def test_caller_times_out(self):
+        batcher = _AzureEmbedBatcher(SimpleNamespace(embeddings=SimpleNamespace(create=lambda **_: threading.Event().wait())), "model", timeout=0.05)
+        with pytest.raises(TimeoutError):
+            batcher.embed("abc")
+
+
+@pytest.fixture(name="azure_env")
+def fixture_azure_env(monkeypatch):
+    """Set the minimum Azure variables and clear the optional ones."""
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key")
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com/")
+    for name in ("AZURE_OPENAI_API_VERSION", "AZURE_OPENAI_DEPLOYMENT_NAME", "AZURE_OPENAI_VISION_DEPLOYMENT"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+class TestInMemoryCollection:
+
+    def _collection(self):
+        embeddings = [[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]]
+        return InMemoryCollection(embeddings, ["a", "b", "c"], [{"id": "a"}, {"id": "b"}, {"id": "c"}])
+
+    def test_returns_nearest_first_with_cosine_distances(self):
+        results = self._collection().query(query_embeddings=[np.array([1.0, 0.1])], n_results=2)
+        assert results["documents"] == [["a", "c"]]
+        assert results["metadatas"][0][0] == {"id": "a"}
+        assert results["distances"][0][0] == pytest.approx(1 - 1 / np.linalg.norm([1.0, 0.1]), abs=1e-6)
+
+    def test_n_results_larger_than_collection(self):
+        results = self._collection().query(query_embeddings=[[0.0, 1.0]], n_results=10)
+        assert results["documents"] == [["b", "c", "a"]]
+
+    def test_quantised_scores_track_float_scores(self, monkeypatch):
+        monkeypatch.setattr(InMemoryCollection, "_QUANTISED_BLOCK_ROWS", 7)
+        embeddings = np.random.default_rng(0).normal(size=(50, 16))
+        exact = InMemoryCollection(embeddings, [str(i) for i in range(50)], [{}] * 50)
+        quantised = InMemoryCollection(embeddings, [str(i) for i in range(50)], [{}] * 50, quantise=True)
+        query = embeddings[3] + 0.1
+        assert quantised.query([query], n_results=1)["documents"] == [["3"]]
+        np.testing.assert_allclose(quantised.query([query], n_results=5)["distances"], exact.query([query], n_results=5)["distances"], atol=0.02)
+
+    def test_from_chroma_exports_collection(self):
+        data = {"embeddings": [[1.0, 0.0]], "documents": ["a"], "metadatas": [{"id": "a"}]}
+        collection = InMemoryCollection.from_chroma(SimpleNamespace(get=lambda include: data))
+        assert collection.count() == 1
+
+
+class TestLoadTableMarkdown:
+
+    def test_renders_each_table_once(self, monkeypatch):
+        table = {"title": "Table 1.1 Demo", "column_headers": ["A"], "data_rows": [["1"]], "footnotes": []}
+        monkeypatch.setattr(resources, "_table_index", {"Table1.1": table})
+        monkeypatch.setattr(resources, "_table_markdown", None)
+        markdown = resources.load_table_markdown()
+        assert markdown == {"Table1.1": "**Table 1.1 Demo**\n| A |\n| --- |\n| 1 |"}
+        assert resources.load_table_markdown() is markdown
+
+
+class TestLoadAnswerCache:
+
+    @pytest.fixture(autouse=True)
+    def _fresh(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(resources, "_answer_cache", None)
+        monkeypatch.setattr(resources, "_env_loaded", True)
+        monkeypatch.setattr(resources, "chroma_path", lambda key: tmp_path / key / "chroma")
+        monkeypatch.setattr(resources, "get_azure_config", lambda: SimpleNamespace(chat_deployment="chat"))
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("NEC_ANSWER_CACHE", raising=False)
+        assert resources.load_answer_cache() is None
+
+    def test_opt_in_stores_per_model(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("NEC_ANSWER_CACHE", "1")
+        cache = resources.load_answer_cache("qwen3")
+        assert cache.cache_dir.is_relative_to(tmp_path / "qwen3")
+        assert resources.load_answer_cache("qwen3") is cache
+
+    def test_chat_deployment_change_uses_a_fresh_directory(self, monkeypatch):
+        monkeypatch.setenv("NEC_ANSWER_CACHE", "1")
+        first = resources.load_answer_cache().cache_dir
+        monkeypatch.setattr(resources, "_answer_cache", None)
+        monkeypatch.setattr(resources, "get_azure_config", lambda: SimpleNamespace(chat_deployment="other"))
+        assert resources.load_answer_cache().cache_dir != first
+
+
+class TestAzureConfig:
+
+    def test_defaults(self, azure_env):  # pylint: disable=unused-argument
+        cfg = AzureConfig.from_env()
+        assert cfg.api_version == "2025-04-01-preview"
+        assert cfg.chat_deployment == cfg.vision_deployment == "gpt-5.2-chat"
+
+    def test_vision_deployment_falls_back_to_chat(self, azure_env):
+        azure_env.setenv("AZURE_OPENAI_DEPLOYMENT_NAME", "chat")
+        assert AzureConfig.from_env().vision_deployment == "chat"
+
+    def test_vision_deployment_override(self, azure_env):
+        azure_env.setenv("AZURE_OPENAI_DEPLOYMENT_NAME", "chat")
+        azure_env.setenv("AZURE_OPENAI_VISION_DEPLOYMENT", "vision")
+        cfg = AzureConfig.from_env()
+        assert (cfg.chat_deployment, cfg.vision_deployment) == ("chat", "vision")
+
+    @pytest.mark.parametrize("missing", ["AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"])
+    def test_missing_credentials_raise(self, azure_env, missing):
+        azure_env.setenv(missing, "  ")
+        with pytest.raises(RuntimeError, match=missing):
+            AzureConfig.from_env()
+
+    def test_is_frozen(self, azure_env):  # pylint: disable=unused-argument
+        cfg = AzureConfig.from_env()
+        with pytest.raises(AttributeError):
+            cfg.api_key = "other"  # type: ignore[misc]
+
+
+class TestPrewarmEmbeddingResources:
+
+    def test_loads_on_background_thread(self, monkeypatch):
+        loaded = []
+        monkeypatch.setattr(resources, "load_embedding_resources", lambda key: loaded.append((key, threading.current_thread().name)))
+        resources.prewarm_embedding_resources("qwen3").join(timeout=5)
+        assert loaded == [("qwen3", "nec-embed-prewarm")]
+
+    def test_failure_is_logged_not_raised(self, monkeypatch, caplog):
+        def _fail(_key):
+            raise RuntimeError("no credentials")
+
+        monkeypatch.setattr(resources, "load_embedding_resources", _fail)
+        resources.prewarm_embedding_resources().join(timeout=5)
+        assert "no credentials" in caplog.text
+
+
+class TestWarmupResources:
+
+    @pytest.fixture(name="loaders_called")
+    def fixture_loaders_called(self, monkeypatch):
+        called = []
+        for name in ("load_cross_encoder", "get_agent_llm", "get_vision_client", "load_table_index", "load_section_index"):
+            monkeypatch.setattr(resources, name, lambda name=name: called.append(name))
+        monkeypatch.setattr(resources, "load_embedding_resources", lambda key: called.append(f"embedding:{key}"))
+        return called
+
+    def test_loads_every_resource(self, loaders_called):
+        resources.warmup_resources("qwen3")
+        assert sorted(loaders_called) == sorted(["embedding:qwen3", "load_cross_encoder", "get_agent_llm", "get_vision_client", "load_table_index", "load_section_index"])
+
+    def test_failure_is_reraised_after_all_tasks(self, loaders_called, monkeypatch):
+        def _fail():
+            raise RuntimeError("no credentials")
+
+        monkeypatch.setattr(resources, "get_agent_llm", _fail)
+        with pytest.raises(RuntimeError, match="no credentials"):
+            resources.warmup_resources()
+        assert "load_table_index" in loaders_called
@@ -7,6 +7,7 @@ they require embedding models / LLM calls respectively.
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+from nec_rag.agent import loaders, tools
 from nec_rag.agent.tools import browse_nec_structure, nec_lookup
 
 # ===========================================================================
@@ -348,3 +349,22 @@ class TestBrowseArticlePart:
         result = browse_nec_structure.invoke({"part": 3})
         assert "Chapter 1:" in result
         assert "Chapter 8:" in result
+
+
+# ===========================================================================
+# browse_nec_structure -- cached no-argument listing
+# ===========================================================================
+
+
+class TestAllChaptersListing:
+
+    def test_listing_is_built_once(self, monkeypatch):
+        chapter = {"chapter_num": 1, "title": "General", "articles": [{"article_num": 90, "title": "Introduction"}]}
+        monkeypatch.setattr(loaders, "_nec_navigation", {"chapters": [chapter], "chapter_by_num": {1: chapter}, "article_by_num": {}})
+        tools._all_chapters_listing.cache_clear()  # pylint: disable=protected-access
+        try:
+            listing = tools.browse_nec_structure.invoke({})
+            assert listing == "Chapter 1: General\n  Article 90: Introduction\n"
+            assert tools.browse_nec_structure.invoke({}) is listing
+        finally:
+            tools._all_chapters_listing.cache_clear()  # pylint: disable=protected-access
@@ -0,0 +1,79 @@
+"""Unit tests for the retrieval, formatting and lookup helpers in nec_rag.agent.utils."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+from types import SimpleNamespace
+
+from nec_rag.agent import loaders
+from nec_rag.agent.resources import InMemoryCollection
+from nec_rag.agent.utils import _format_table_as_markdown, _rerank, _retrieve, _retrieve_batch, cached_article_outline, suggest_similar_ids
+
+
+class TestSuggestSimilarIds:
+
+    IDS = tuple(sorted(["110.26", "250.50", "250.52", "250.53", "250.54", "250.56", "650.50", "Table310.16", "Table310.17"]))
+
+    def test_prefers_ids_from_the_same_article(self):
+        assert sorted(suggest_similar_ids("250.500", self.IDS)) == ["250.50", "250.52", "250.53", "250.54", "250.56"]
+
+    def test_falls_back_to_full_scan_for_sparse_prefix(self):
+        assert "250.50" in suggest_similar_ids("205.50", self.IDS)
+
+    def test_id_without_dot_scans_everything(self):
+        assert suggest_similar_ids("25050", self.IDS)[0] == "250.50"
+
+    def test_table_prefix(self):
+        assert sorted(suggest_similar_ids("Table310.1", self.IDS, n=2)) == ["Table310.16", "Table310.17"]
+
+
+class TestCachedArticleOutline:
+
+    def test_outline_is_built_once_per_article_and_part(self, monkeypatch):
+        subsection = {"id": "90.1", "title": "Scope.", "page": 1, "front_matter": "This Code covers...", "sub_items": []}
+        article = {"article_num": 90, "title": "Introduction", "parts": [{"part_num": None, "title": None, "subsections": [subsection]}]}
+        monkeypatch.setattr(loaders, "_nec_navigation", {"chapters": [], "chapter_by_num": {}, "article_by_num": {90: article}})
+        cached_article_outline.cache_clear()
+        try:
+            outline = cached_article_outline(90)
+            assert outline.startswith("Article 90: Introduction")
+            assert cached_article_outline(90) is outline
+            assert cached_article_outline.cache_info().hits == 1
+        finally:
+            cached_article_outline.cache_clear()
+
+
+class TestRetrieveBatch:
+
+    @staticmethod
+    def _collection():
+        metadatas = [{"section_id": "90.1"}, {"section_id": "250.50"}]
+        return InMemoryCollection([[1.0, 0.0], [0.0, 1.0]], ["scope", "electrode"], metadatas)
+
+    def test_one_result_list_per_query_in_order(self):
+        vectors = {"scope question": [1.0, 0.0], "electrode question": [0.0, 1.0]}
+        batches = _retrieve_batch(["electrode question", "scope question"], vectors.get, self._collection(), n_results=1)
+        assert [[item["metadata"]["section_id"] for item in batch] for batch in batches] == [["250.50"], ["90.1"]]
+
+    def test_single_query_matches_retrieve(self):
+        collection = self._collection()
+        assert _retrieve("q", lambda _text: [1.0, 0.2], collection, n_results=2) == _retrieve_batch(["q"], lambda _text: [1.0, 0.2], collection, n_results=2)[0]
+
+
+class TestFormatTableAsMarkdown:
+
+    def test_headers_rows_and_footnotes(self):
+        table = {"title": "Table 1", "column_headers": ["A", "B"], "data_rows": [["1", "2"]], "footnotes": ["Note 1."]}
+        assert _format_table_as_markdown(table) == "**Table 1**\n| A | B |\n| --- | --- |\n| 1 | 2 |\n> Note 1."
+
+    def test_no_headers_skips_grid(self):
+        table = {"title": "Table 2", "column_headers": [], "data_rows": [["ignored"]]}
+        assert _format_table_as_markdown(table) == "**Table 2**"
+
+
+class TestRerank:
+
+    def test_top_reranked_first_then_embedding_extras(self):
+        retrieved = [{"document": doc} for doc in "abcde"]
+        cross_encoder = SimpleNamespace(predict=lambda pairs: [0.1, 0.9, 0.5, 0.9, 0.2])
+        merged = _rerank("q", retrieved, cross_encoder, top_n_rerank=2, top_n_embed=2)
+        assert [item["document"] for item in merged] == ["b", "d", "a"]
@@ -7,8 +7,8 @@ Tests cover:
   - clean: full pipeline integration and text conversion
 """
 
-from nec_rag.data_preprocessing.text_cleaning import hyphens_endline, remove_junk_pages, sentence_runover
-from nec_rag.data_preprocessing.text_cleaning.clean import paragraphs_to_text, run_cleaning_pipeline
+from nec_rag.data_preprocessing.text_cleaning import hyphens_endline, remove_junk_pages, remove_page_furniture, sentence_runover
+from nec_rag.data_preprocessing.text_cleaning.clean import dehyphenate_and_strip_furniture, paragraphs_to_text, run_cleaning_pipeline
 
 # ---------------------------------------------------------------------------
 # Helpers to build paragraph dicts quickly
@@ -476,3 +476,19 @@ class TestRunCleaningPipeline:
         # Only the real content should remain
         assert len(result) == 1
         assert result["0"]["content"] == "real content"
+
+    def test_fused_final_pass_matches_separate_steps(self):
+        """The fused hyphen + furniture pass should equal running the two steps back to back."""
+        paras = make_paragraphs(
+            [
+                ("electri- cal systems", 100),
+                ("70-23", 100),
+                ("CHAPTER 1", 101),
+                ("normal content", 101),
+                ("EDUFIRE.IR", 102),
+                ("con- ductors shall", 102),
+            ]
+        )
+        expected = remove_page_furniture.run(hyphens_endline.run(paras))
+        assert dehyphenate_and_strip_furniture(paras) == expected
+        assert contents(expected) == ["electrical systems", "normal content", "conductors shall"]
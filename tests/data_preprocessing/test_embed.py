@@ -0,0 +1,18 @@
+"""Unit tests for helpers in the embedding pipeline."""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring,protected-access
+
+import pytest
+
+from nec_rag.data_preprocessing.embedding import embed
+
+
+class TestNormaliseRows:
+
+    def test_rows_have_unit_length(self):
+        rows = embed._normalise_rows([[3.0, 4.0], [0.0, 2.0]])
+        assert rows[0] == pytest.approx([0.6, 0.8])
+        assert rows[1] == pytest.approx([0.0, 1.0])
+
+    def test_zero_vector_is_left_unchanged(self):
+        assert embed._normalise_rows([[0.0, 0.0]]) == [[0.0, 0.0]]